@@ -0,0 +1,290 @@
+"""
+Benchmark: Throughput and Peak Memory of the Hot Paths
+
+Times the growth engines (expand_seed, grow, explore_seed and their
+batched forms), the influence-matrix builders and the binary codec over
+a range of shell depths and batch sizes. Each case reports
+
+    seconds      best time per call over a few repeats
+    shells_per_s shells produced per second (growth engines)
+    seeds_per_s  seeds processed per second (batched engines, codec)
+    peak_bytes   peak Python/NumPy allocation during one call
+                 (tracemalloc, measured in a separate, untimed call)
+
+Results are written as JSON, keyed by case name, so two runs (e.g. two
+commits) can be compared:
+
+    python benchmark.py results.json                  # full suite
+    python benchmark.py new.json --baseline old.json  # and compare
+    python benchmark.py --quick --only expand         # subset
+"""
+
+import functools
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+
+import numpy as np
+
+import orbital_octa_v2
+import seed_expansion
+from seed_expansion import (
+    expand_seed,
+    expand_seeds_batch,
+    encode_seed_binary,
+    decode_seed_binary,
+    encode_seeds_binary,
+    decode_seeds_binary,
+)
+from orbital_octa_v2 import grow
+from seed_exploration import explore_seed, explore_seeds_batch
+
+RESULTS_VERSION = 1
+
+SEED = np.array([0.5, 0.2, 0.15, 0.08, 0.05, 0.02])
+
+
+# =============================================================================
+# CASES
+# =============================================================================
+
+def benchmark_cases(quick=False):
+    """
+    Yield (name, fn, work) for every benchmark case.
+
+    fn takes no arguments; work is {'shells': ..., 'seeds': ...} per
+    call, used to turn times into throughput. quick trims the largest
+    depths and batches.
+    """
+    depths = [10, 100] if quick else [10, 100, 1000]
+    batches = [100, 10_000] if quick else [100, 10_000, 100_000]
+    codec_sizes = [1000, 100_000] if quick else [1000, 100_000, 1_000_000]
+    seeds = np.random.default_rng(0).dirichlet(np.ones(6), size=max(max(batches), max(codec_sizes)))
+
+    for steps in depths:
+        yield (f"expand_seed[steps={steps}]",
+               lambda steps=steps: expand_seed(SEED, steps=steps),
+               {'shells': steps + 1, 'seeds': 1})
+    for steps in depths:
+        yield (f"grow[steps={steps}]",
+               lambda steps=steps: grow(SEED, steps=steps),
+               {'shells': steps + 1, 'seeds': 1})
+    for steps in depths[:2]:
+        yield (f"explore_seed[steps={steps}]",
+               lambda steps=steps: explore_seed(SEED, steps=steps),
+               {'shells': steps + 1, 'seeds': 1})
+
+    for n in batches:
+        for dtype in (np.float64, np.float32):
+            yield (f"expand_seeds_batch[n={n},steps=20,dtype={np.dtype(dtype).name}]",
+                   lambda n=n, dtype=dtype: expand_seeds_batch(seeds[:n], steps=20, dtype=dtype),
+                   {'shells': 21 * n, 'seeds': n})
+    for n in batches[:2]:
+        yield (f"explore_seeds_batch[n={n},steps=15]",
+               lambda n=n: explore_seeds_batch(seeds[:n], steps=15),
+               {'shells': 16 * n, 'seeds': n})
+
+    # Uncached builds (the public functions are memoized)
+    yield ("build_influence_matrix[seed_expansion]",
+           seed_expansion.build_influence_matrix.__wrapped__, {})
+    yield ("build_influence_matrix[orbital,sharpness=2]",
+           lambda: orbital_octa_v2.build_influence_matrix.__wrapped__(2.0), {})
+
+    yield ("encode_seed_binary", lambda: encode_seed_binary(SEED), {'seeds': 1})
+    yield ("decode_seed_binary", lambda: decode_seed_binary([127, 51, 38, 20, 12]), {'seeds': 1})
+    for n in codec_sizes:
+        yield (f"encode_seeds_binary[n={n}]",
+               lambda n=n: encode_seeds_binary(seeds[:n]), {'seeds': n})
+        # Encoded on the warm-up call, so only selected cases pay for it
+        packed = functools.cache(lambda n=n: encode_seeds_binary(seeds[:n]))
+        yield (f"decode_seeds_binary[n={n}]",
+               lambda packed=packed: decode_seeds_binary(packed()), {'seeds': n})
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+def measure(fn, repeat=3, min_time=0.1):
+    """
+    Time fn and record its peak memory.
+
+    Calls are batched so each sample lasts at least min_time; the best
+    of `repeat` samples is kept. Peak memory comes from one extra call
+    under tracemalloc, so tracing never inflates the timings.
+
+    Returns {'seconds': per-call time, 'calls': calls per sample,
+    'peak_bytes': peak traced allocation}.
+    """
+    fn()  # Warm caches (kernel tables, influence matrices)
+
+    calls = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time or calls >= 1 << 20:
+            break
+        calls *= max(2, min(int(min_time / max(elapsed, 1e-9)) + 1, 100))
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'seconds': best / calls, 'calls': calls, 'peak_bytes': peak}
+
+
+def run_benchmarks(quick=False, only=None, repeat=3, min_time=0.1, verbose=True):
+    """
+    Run the benchmark cases.
+
+    Parameters:
+    -----------
+    quick : bool
+        Smaller depths and batches
+    only : str, optional
+        Run only cases whose name contains this substring
+    repeat, min_time :
+        As for measure()
+    verbose : bool
+        Print one line per case as it finishes
+
+    Returns:
+    --------
+    results : dict
+        {'version', 'meta': {...environment...}, 'cases': {name: {...}}}
+    """
+    cases = {}
+    for name, fn, work in benchmark_cases(quick):
+        if only and only not in name:
+            continue
+        case = measure(fn, repeat=repeat, min_time=min_time)
+        for unit in ('shells', 'seeds'):
+            if unit in work:
+                case[f'{unit}_per_s'] = work[unit] / case['seconds']
+        cases[name] = case
+        if verbose:
+            print(_format_case(name, case))
+    return {'version': RESULTS_VERSION, 'meta': environment(), 'cases': cases}
+
+
+def environment():
+    """Machine, library versions and commit the results belong to."""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)), check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'commit': commit,
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+# =============================================================================
+# RESULTS
+# =============================================================================
+
+def write_results(results, path):
+    """Write results as JSON (atomically)."""
+    tmp = path + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(results, baseline, threshold=0.10):
+    """
+    Compare two result sets case by case.
+
+    Returns a list of (name, speedup, memory_ratio, flag) for cases in
+    both: speedup = baseline time / current time, memory_ratio =
+    current peak / baseline peak, and flag is 'slower' / 'faster' when
+    the time changed by more than threshold ('' otherwise).
+    """
+    rows = []
+    for name, case in results['cases'].items():
+        base = baseline['cases'].get(name)
+        if base is None:
+            continue
+        speedup = base['seconds'] / case['seconds']
+        memory = case['peak_bytes'] / base['peak_bytes'] if base['peak_bytes'] else float('nan')
+        flag = ''
+        if speedup < 1 - threshold:
+            flag = 'slower'
+        elif speedup > 1 + threshold:
+            flag = 'faster'
+        rows.append((name, speedup, memory, flag))
+    return rows
+
+
+def _format_case(name, case):
+    rate = ''
+    if 'shells_per_s' in case:
+        rate = f"{case['shells_per_s']:>12.3g} shells/s"
+    elif 'seeds_per_s' in case:
+        rate = f"{case['seeds_per_s']:>12.3g} seeds/s "
+    return (f"{name:<52} {case['seconds'] * 1e3:>10.3f} ms {rate:>21}"
+            f" {case['peak_bytes'] / 1024:>10.1f} KiB")
+
+
+# =============================================================================
+# MAIN
+# =============================================================================
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('output', nargs='?', help="write results to this JSON file")
+    parser.add_argument('--baseline', help="compare against an earlier results file")
+    parser.add_argument('--quick', action='store_true', help="smaller depths and batches")
+    parser.add_argument('--only', help="run cases whose name contains this substring")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--min-time', type=float, default=0.1)
+    args = parser.parse_args()
+
+    print("="*60)
+    print("BENCHMARKS")
+    print("="*60)
+    print()
+
+    results = run_benchmarks(quick=args.quick, only=args.only,
+                             repeat=args.repeat, min_time=args.min_time)
+    if args.output:
+        write_results(results, args.output)
+        print(f"\nWrote {len(results['cases'])} cases to {args.output}")
+
+    if args.baseline:
+        baseline = load_results(args.baseline)
+        print("\n" + "-"*60)
+        print(f"COMPARISON vs {baseline['meta'].get('commit') or args.baseline}")
+        print("-"*60)
+        for name, speedup, memory, flag in compare(results, baseline):
+            print(f"{name:<52} {speedup:>6.2f}x time  {memory:>6.2f}x memory  {flag}")
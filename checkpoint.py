@@ -0,0 +1,228 @@
+"""
+Checkpoint: Resumable Growth State
+
+Restarting growth from the last shell's S drops the inner-shell history
+the field needs, so the continued run drifts from an uninterrupted one.
+A checkpoint stores everything the growth loop reads instead:
+
+    shells   r, E, S, id and error of the shells future steps can still
+             reach (or the full history)
+    W        the influence matrix the run used
+    params   growth parameters, working dtype, horizon bookkeeping,
+             format version
+
+in a single compressed .npz file (no pickled objects). Resuming feeds
+the same state back into the same loop, so a run that is paused,
+saved, loaded and continued produces bit-identical shells.
+
+Supported engines:
+    'grow'   - orbital_octa_v2.grow
+    'expand' - seed_expansion.expand_seed
+"""
+
+import json
+import os
+
+import numpy as np
+
+import orbital_octa_v2
+import seed_expansion
+from shell_stack import ShellStack
+
+# Bump when the stored layout changes
+CHECKPOINT_VERSION = 2
+
+# Growth parameters each engine needs to continue
+ENGINE_PARAMS = {
+    'grow': ('rho', 'epsilon', 'sigma', 'sharpness', 'tol'),
+    'expand': ('rho', 'epsilon', 'sigma_scale', 'tol'),
+}
+
+
+# =============================================================================
+# SAVE
+# =============================================================================
+
+def save_checkpoint(path, shells, engine=None, window=True, **params):
+    """
+    Write the state needed to continue a growth run.
+
+    Parameters:
+    -----------
+    path : str
+        Output file; written to a temporary file first and moved into
+        place, so a job killed mid-write leaves the old checkpoint intact
+    shells : ShellStack
+        Shells grown so far (from grow / expand_seed, or a resumed run)
+    engine : str, optional
+        'grow' or 'expand' (default: the engine recorded in
+        shells.params)
+    window : bool
+        Store only the shells later steps can still reach (default)
+        instead of the full history
+    **params
+        Growth parameters the run used (rho, epsilon, sigma or
+        sigma_scale, sharpness, tol). Only needed for stacks that do
+        not record them in shells.params; given ones must agree with
+        the recorded values. A missing parameter raises ValueError
+        rather than falling back to a default the run may not have used.
+    """
+    engine, params = _engine_params(engine, shells.params, params)
+    n = len(shells)
+    if n == 0:
+        raise ValueError("cannot checkpoint an empty shell structure")
+
+    dtype = shells.dtype
+    E_dropped = 0.0
+    if engine == 'grow':
+        W = orbital_octa_v2.build_influence_matrix(params['sharpness'], dtype)
+        lo, E_dropped = orbital_octa_v2.horizon_state(
+            shells.r, shells.E, params['rho'], params['sigma'], params['tol']
+        )
+    else:
+        W = seed_expansion.build_influence_matrix(dtype)
+        # Taps past the kernel length underflow to 0 (see envelope_kernel)
+        taps = seed_expansion.envelope_kernel_length(params['rho'], params['sigma_scale'])
+        lo = n - min(max(taps, 1), n)
+
+    first = lo if window else 0
+    meta = {
+        'version': CHECKPOINT_VERSION,
+        'engine': engine,
+        'params': params,
+        'dtype': dtype.name,
+        'lo': lo - first,
+        'E_dropped': float(E_dropped),
+        'error_bound': float(shells.error_bound),
+    }
+
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        np.savez_compressed(
+            f,
+            meta=np.array(json.dumps(meta)),
+            id=shells.id[first:],
+            r=shells.r[first:],
+            E=shells.E[first:],
+            S=shells.S[first:],
+            error=shells.error[first:],
+            W=np.asarray(W),
+        )
+    os.replace(tmp, path)
+
+
+# =============================================================================
+# LOAD AND RESUME
+# =============================================================================
+
+def load_checkpoint(path):
+    """
+    Read a checkpoint written by save_checkpoint.
+
+    Returns:
+    --------
+    shells : ShellStack
+        The stored shells (shells.params holds the engine and its
+        growth parameters)
+    W : ndarray
+        Influence matrix of the run
+    meta : dict
+        'engine', 'params', 'dtype' (working precision of the run),
+        'lo' (first shell the next step reads), 'E_dropped',
+        'error_bound', 'version'
+    """
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(str(data['meta']))
+        if meta['version'] == 1:
+            # Version 1 predates the stored dtype; every run was float64
+            meta['dtype'] = 'float64'
+        elif meta['version'] != CHECKPOINT_VERSION:
+            raise ValueError(
+                f"unsupported checkpoint version {meta['version']} "
+                f"(expected {CHECKPOINT_VERSION})"
+            )
+        shells = ShellStack(capacity=len(data['r']), dtype=np.dtype(meta['dtype']))
+        for shell_id, r, E, S, error in zip(data['id'], data['r'], data['E'],
+                                             data['S'], data['error']):
+            shells.append(r, E, S, id=shell_id, error=error)
+        W = data['W']
+
+    shells.error_bound = meta['error_bound']
+    shells.params = {'engine': meta['engine'], **meta['params']}
+    return shells, W, meta
+
+
+def resume_from_checkpoint(path, steps):
+    """
+    Continue a checkpointed run for `steps` more shells.
+
+    The result is bit-identical to growing the same number of shells
+    in one uninterrupted call, at the run's working dtype.
+
+    Returns:
+    --------
+    For 'grow': (shells, W), as orbital_octa_v2.grow
+    For 'expand': shells, as seed_expansion.expand_seed
+
+    shells holds the stored shells followed by the new ones; ids
+    continue from the checkpoint.
+    """
+    shells, W, meta = load_checkpoint(path)
+    params = meta['params']
+    dtype = shells.dtype
+    lo = meta['lo']
+    history = (shells.E[lo:], shells.S[lo:], 2 * shells.error[lo:])
+
+    if meta['engine'] == 'grow':
+        expected = orbital_octa_v2.build_influence_matrix(params['sharpness'], dtype)
+        if not np.array_equal(W, expected):
+            raise ValueError("checkpoint influence matrix does not match this build")
+        steps_iter = orbital_octa_v2._growth_steps(
+            shells.r[lo:], *history, steps, params['rho'], params['epsilon'],
+            params['sigma'], orbital_octa_v2.influence_operator(params['sharpness'], dtype),
+            params['tol'], E_dropped=meta['E_dropped']
+        )
+    else:
+        if not np.array_equal(W, seed_expansion.build_influence_matrix(dtype)):
+            raise ValueError("checkpoint influence matrix does not match this build")
+        steps_iter = seed_expansion._expansion_steps(
+            shells.r[-1], *history, steps, params['rho'], params['epsilon'],
+            params['sigma_scale'], params['tol'], dtype
+        )
+
+    err_max = 0.0
+    for r, E, S, err in steps_iter:
+        shells.append(r, E, S, error=err / 2)
+        err_max = max(err_max, err)
+    shells.error_bound = max(shells.error_bound, err_max / 2)
+
+    if meta['engine'] == 'grow':
+        return shells, W
+    return shells
+
+
+def _engine_params(engine, recorded, params):
+    # Merge the parameters recorded on the stack with the given ones
+    recorded = dict(recorded or {})
+    recorded_engine = recorded.pop('engine', None)
+    if engine is None:
+        engine = recorded_engine
+    if engine not in ENGINE_PARAMS:
+        raise ValueError(f"unknown engine {engine!r}; expected one of {sorted(ENGINE_PARAMS)}")
+    if recorded_engine not in (None, engine):
+        raise ValueError(f"shells were grown by {recorded_engine!r}, not {engine!r}")
+
+    names = ENGINE_PARAMS[engine]
+    unknown = set(params) - set(names)
+    if unknown:
+        raise ValueError(f"unexpected parameters for {engine!r}: {sorted(unknown)}")
+    conflicting = sorted(name for name in params
+                         if name in recorded and float(params[name]) != float(recorded[name]))
+    if conflicting:
+        raise ValueError(f"parameters differ from those the shells were grown with: {conflicting}")
+    merged = {**recorded, **params}
+    missing = [name for name in names if name not in merged]
+    if missing:
+        raise ValueError(f"missing growth parameters for {engine!r}: {missing} "
+                         f"(the shells do not record them; pass them explicitly)")
+    return engine, {name: float(merged[name]) for name in names}
@@ -0,0 +1,248 @@
+"""
+Expansion Cache: Content-Addressed Memoization of expand_seed
+
+Seeds travel as quantized records (encode_seed_binary), so the same
+record decodes to the same proportions every time and its expansion is
+fully determined by (record bytes, growth parameters). ExpansionCache
+keys expansions by a hash of exactly that.
+
+Causality makes depth flexible:
+- a request shallower than a cached expansion is served by a prefix
+  of it;
+- a request deeper than a cached expansion extends it in place from
+  its last shells (the same step engine as expand_seed, so the result
+  is bit-identical to expanding from scratch).
+
+The in-memory tier is an LRU bounded by bytes; an optional directory
+tier keeps every expansion across processes and restarts, with its
+dtype and recorded growth parameters (shells.params), so a stack loaded
+from disk extends and checkpoints like a fresh one.
+"""
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+from seed_expansion import (
+    expand_seed,
+    encode_seeds_binary,
+    decode_seeds_binary,
+    seed_record_size,
+    _expansion_steps,
+)
+from shell_stack import ShellStack
+
+# Growth parameters taking part in the key, with expand_seed's defaults
+CACHE_PARAMS = {'E0': 1.0, 'r0': 1.0, 'rho': 1.5, 'epsilon': 0.6,
+                'sigma_scale': 0.5, 'tol': 0.0}
+
+
+class ExpansionCache:
+    """
+    Memoizes expand_seed on quantized seeds.
+
+    Parameters:
+    -----------
+    max_bytes : int
+        Memory budget for cached shell arrays; least recently used
+        expansions are evicted beyond it
+    directory : str, optional
+        On-disk tier (one .npz per expansion, written through)
+    bits_per_value : int
+        Quantization of proportional seeds passed to expand()
+
+    Attributes:
+    -----------
+    stats : dict
+        'hits' (cached deep enough), 'extended' (deepened from a
+        shallower entry), 'disk_hits', 'misses', 'evictions'
+    """
+
+    def __init__(self, max_bytes=64 << 20, directory=None, bits_per_value=8):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.bits_per_value = bits_per_value
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        self.stats = dict.fromkeys(('hits', 'extended', 'disk_hits', 'misses', 'evictions'), 0)
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def key(self, record, **params):
+        """Content hash of an encoded seed record and its growth parameters."""
+        params = {**CACHE_PARAMS, **{k: float(v) for k, v in params.items()}}
+        digest = hashlib.sha256(bytes(record))
+        digest.update(json.dumps(params, sort_keys=True).encode())
+        digest.update(str(self.bits_per_value).encode())
+        return digest.hexdigest()
+
+    def expand(self, seed, steps=10, **params):
+        """
+        expand_seed for a quantized seed, served from the cache.
+
+        Parameters:
+        -----------
+        seed : bytes or array-like
+            An encoded record (encode_seeds_binary, bits_per_value of
+            the cache) or proportions, which are quantized first
+        steps : int
+            Shells beyond the seed
+        **params
+            E0, r0, rho, epsilon, sigma_scale, tol
+
+        Returns:
+        --------
+        shells : ShellStack
+            Read-only view of steps + 1 shells; append to it freely
+            (appending reallocates), but do not write into its arrays
+        """
+        unknown = set(params) - set(CACHE_PARAMS)
+        if unknown:
+            raise TypeError(f"unexpected growth parameters: {sorted(unknown)}")
+        if isinstance(seed, (bytes, bytearray, memoryview)):
+            record = bytes(seed)
+            if len(record) != seed_record_size(self.bits_per_value):
+                raise ValueError(f"expected a {seed_record_size(self.bits_per_value)}-byte record")
+        else:
+            record = encode_seeds_binary(seed, self.bits_per_value)
+        key = self.key(record, **params)
+
+        shells = self._entries.get(key)
+        if shells is None and self.directory is not None:
+            shells = self._load(key)
+            if shells is not None:
+                self.stats['disk_hits'] += 1
+                self._insert(key, shells)
+
+        if shells is None:
+            self.stats['misses'] += 1
+            proportions = decode_seeds_binary(record, self.bits_per_value)[0]
+            shells = expand_seed(proportions, steps=steps, **params)
+            self._insert(key, shells)
+            self._store(key, shells)
+        elif len(shells) <= steps:
+            self.stats['extended'] += 1
+            self._extend(key, shells, steps, params)
+            self._store(key, shells)
+        else:
+            self.stats['hits'] += 1
+            self._entries.move_to_end(key)
+
+        return _read_only(shells[:steps + 1])
+
+    def clear(self):
+        """Drop the in-memory tier (the directory tier is kept)."""
+        self._entries.clear()
+        self.nbytes = 0
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _extend(self, key, shells, steps, params):
+        params = {**CACHE_PARAMS, **params}
+        self.nbytes -= shells.nbytes
+        err_max = 2 * shells.error_bound
+        for r, E, S, err in _expansion_steps(
+                shells.r[-1], shells.E, shells.S, 2 * shells.error,
+                steps + 1 - len(shells), params['rho'], params['epsilon'],
+                params['sigma_scale'], params['tol'], shells.dtype):
+            shells.append(r, E, S, error=err / 2)
+            err_max = max(err_max, err)
+        shells.error_bound = err_max / 2
+        self.nbytes += shells.nbytes
+        self._entries.move_to_end(key)
+        self._evict()
+
+    def _insert(self, key, shells):
+        self._entries[key] = shells
+        self.nbytes += shells.nbytes
+        self._evict()
+
+    def _evict(self):
+        # Never evicts the entry just used (the most recent one)
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            _, shells = self._entries.popitem(last=False)
+            self.nbytes -= shells.nbytes
+            self.stats['evictions'] += 1
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + '.npz')
+
+    def _store(self, key, shells):
+        if self.directory is None:
+            return
+        tmp = self._path(key) + '.tmp'
+        with open(tmp, 'wb') as f:
+            np.savez(f, r=shells.r, E=shells.E, S=shells.S, error=shells.error,
+                     error_bound=shells.error_bound, params=np.array(json.dumps(shells.params)))
+        os.replace(tmp, self._path(key))
+
+    def _load(self, key):
+        try:
+            data = np.load(self._path(key))
+        except FileNotFoundError:
+            return None
+        with data:
+            if 'params' not in data.files:
+                return None  # Written before params were stored: recompute
+            shells = ShellStack(capacity=len(data['r']), dtype=data['S'].dtype)
+            for r, E, S, error in zip(data['r'], data['E'], data['S'], data['error']):
+                shells.append(r, E, S, error=error)
+            shells.error_bound = float(data['error_bound'])
+            shells.params = json.loads(str(data['params']))
+        return shells
+
+
+def _read_only(view):
+    for name in view._array_names():
+        getattr(view, name).flags.writeable = False
+    return view
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    import tempfile
+    import time
+
+    print("="*60)
+    print("EXPANSION CACHE")
+    print("="*60)
+
+    rng = np.random.default_rng(0)
+    distinct = rng.dirichlet(np.ones(6), size=50)
+    traffic = distinct[rng.integers(0, 50, size=2000)]
+    depths = rng.integers(5, 40, size=2000)
+
+    cache = ExpansionCache(max_bytes=1 << 20, directory=tempfile.mkdtemp())
+    t0 = time.perf_counter()
+    for seed, steps in zip(traffic, depths):
+        cache.expand(seed, steps=int(steps))
+    t1 = time.perf_counter()
+    print(f"\n2000 requests over 50 seeds: {t1 - t0:.2f}s")
+    print(f"Stats: {cache.stats}")
+
+    # Served shells equal a fresh expansion of the quantized seed
+    record = encode_seeds_binary(distinct[7])
+    served = cache.expand(record, steps=60)
+    fresh = expand_seed(decode_seeds_binary(record)[0], steps=60)
+    match = np.array_equal(served.S, fresh.S)
+    print(f"Extended expansion bit-identical to expand_seed: {match}")
+
+    cache.clear()
+    again = cache.expand(record, steps=30)
+    match_disk = np.array_equal(again.S, fresh.S[:31])
+    print(f"Prefix from disk tier matches: {match_disk} (disk hits: {cache.stats['disk_hits']})")
+    print(f"\nStatus: {'PASS' if match and match_disk else 'FAIL'}")
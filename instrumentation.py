@@ -0,0 +1,218 @@
+"""
+Instrumentation: Opt-In Counters, Phase Timers and Shell Hooks
+
+The growth engines (expand_seed, grow, explore_seed and everything
+built on their step loops) look up the active Recorder once per run,
+when the step generator is created: a lazy Expansion or iter_expand
+consumed after its instrument() block reports to the recorder that was
+active when it was made (or to none). With none active, which is the
+default, each step pays a handful of `is None` checks and nothing else.
+
+    with instrument() as rec:
+        explore_seed(seed, steps=50)
+    print(rec.dominant_phase())
+    rec.to_json("profile.json")
+
+Counters:
+    field_evals   fields sampled at a new radius (one per shell formed
+                  from inner shells)
+    envelope_exp  envelope exponentials evaluated (expand_seed uses a
+                  precomputed kernel and evaluates none per shell)
+    kernel_taps   kernel coefficients applied by expand_seed
+    contractions  envelope-weighted sums over inner shells (one
+                  vector-matrix product each)
+    influence_apply
+                  applications of W (elementwise with its diagonal for
+                  the octahedron, see apply_influence)
+    shells        shells formed, per engine ('shells.expand', ...)
+
+Phases (seconds and calls, per engine):
+    field, normalize, error_bound          all engines
+    horizon (incl. dynamic epsilon),
+    dynamic_sigma, resonance,
+    saturation, prune_and_reinvest, expand explore_seed
+
+The recorder is process-local and not thread-safe; use one per thread
+of work.
+"""
+
+import functools
+import json
+import time
+from contextlib import contextmanager
+
+_active = None
+
+
+def active():
+    """The Recorder currently collecting, or None."""
+    return _active
+
+
+def with_recorder(steps):
+    """
+    Decorator for an engine's step generator: passes the Recorder
+    active when the generator is created as recorder=, instead of the
+    one active whenever it happens to be advanced.
+    """
+    @functools.wraps(steps)
+    def wrapper(*args, **kwargs):
+        return steps(*args, recorder=_active, **kwargs)
+    return wrapper
+
+
+@contextmanager
+def instrument(on_shell=None):
+    """
+    Collect instrumentation for the growth runs inside the block.
+
+    Parameters:
+    -----------
+    on_shell : callable, optional
+        Called once per shell formed with a dict: 'engine', 'step'
+        (shells grown in this run), 'r', 'E', 'S' (a view into the
+        engine's buffer; copy it to keep it), 'error', 'seconds' (time
+        spent forming the shell) and, for explore, 'mode' and 'epsilon'
+
+    Yields the Recorder. Blocks nest; the inner recorder takes over
+    until it exits.
+    """
+    global _active
+    previous = _active
+    recorder = Recorder(on_shell)
+    _active = recorder
+    try:
+        yield recorder
+    finally:
+        _active = previous
+        recorder.wall_seconds = time.perf_counter() - recorder._started
+
+
+class Recorder:
+    """
+    Counters, phase timers and the per-shell hook for one instrument().
+
+    Attributes:
+    -----------
+    counters : dict
+        Name -> count
+    phases : dict
+        'engine.phase' -> [calls, seconds]
+    wall_seconds : float
+        Duration of the instrument() block (set when it exits)
+    """
+
+    def __init__(self, on_shell=None):
+        self.on_shell = on_shell
+        self.counters = {}
+        self.phases = {}
+        self.wall_seconds = None
+        self._engine = ''
+        self._started = self._last = self._shell_start = time.perf_counter()
+
+    # -------------------------------------------------------------------------
+    # Engine-side API
+    # -------------------------------------------------------------------------
+
+    def count(self, name, k=1):
+        self.counters[name] = self.counters.get(name, 0) + k
+
+    def lap(self, engine):
+        """Start timing a new shell of `engine`."""
+        self._engine = engine
+        self._last = self._shell_start = time.perf_counter()
+
+    def tick(self, phase):
+        """Charge the time since the last lap/tick to `phase`."""
+        now = time.perf_counter()
+        key = f"{self._engine}.{phase}"
+        entry = self.phases.get(key)
+        if entry is None:
+            self.phases[key] = [1, now - self._last]
+        else:
+            entry[0] += 1
+            entry[1] += now - self._last
+        self._last = now
+
+    def shell(self, step, r, E, S, error=0.0, **extra):
+        """Record a finished shell and call the hook."""
+        self.count('shells.' + self._engine)
+        if self.on_shell is not None:
+            self.on_shell({
+                'engine': self._engine, 'step': step, 'r': float(r), 'E': float(E),
+                'S': S, 'error': error / 2,
+                'seconds': time.perf_counter() - self._shell_start, **extra
+            })
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+
+    def dominant_phase(self):
+        """The phase with the most accumulated time, or None."""
+        if not self.phases:
+            return None
+        return max(self.phases, key=lambda key: self.phases[key][1])
+
+    def summary(self):
+        """
+        JSON-ready summary: counters, phases (calls, seconds, share of
+        all phase time), dominant phase and wall time.
+        """
+        total = sum(seconds for _, seconds in self.phases.values())
+        phases = {
+            key: {'calls': calls, 'seconds': seconds,
+                  'share': seconds / total if total else 0.0}
+            for key, (calls, seconds) in sorted(self.phases.items())
+        }
+        return {
+            'counters': dict(sorted(self.counters.items())),
+            'phases': phases,
+            'dominant_phase': self.dominant_phase(),
+            'phase_seconds': total,
+            'wall_seconds': self.wall_seconds,
+        }
+
+    def to_json(self, path=None, **kwargs):
+        """Summary as a JSON string, also written to path if given."""
+        text = json.dumps(self.summary(), indent=2, **kwargs)
+        if path is not None:
+            with open(path, 'w') as f:
+                f.write(text)
+        return text
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    import numpy as np
+    # The engines consult the imported module, not this __main__ copy
+    from instrumentation import instrument
+    from seed_expansion import expand_seed
+    from orbital_octa_v2 import grow
+    from seed_exploration import explore_seed
+
+    print("="*60)
+    print("INSTRUMENTATION")
+    print("="*60)
+
+    seed = np.array([0.5, 0.2, 0.15, 0.08, 0.05, 0.02])
+    modes = []
+    with instrument(on_shell=lambda shell: modes.append(shell.get('mode'))) as rec:
+        expand_seed(seed, steps=40)
+        grow(seed, steps=40)
+        explore = explore_seed(seed, steps=40, E0=10.0)
+
+    summary = rec.summary()
+    print(f"\nCounters: {summary['counters']}")
+    print("\nPhases:")
+    for key, phase in summary['phases'].items():
+        print(f"  {key:<32} {phase['calls']:>5} calls  "
+              f"{phase['seconds'] * 1e3:8.3f} ms  {phase['share']:6.1%}")
+    print(f"\nDominant phase: {summary['dominant_phase']}")
+
+    hooked = modes[-40:] == [shell['mode'] for shell in explore][1:]
+    print(f"Hook saw every explore shell: {hooked}")
+    print(f"\nStatus: {'PASS' if hooked and rec.counters['shells.explore'] == 40 else 'FAIL'}")
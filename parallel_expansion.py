@@ -0,0 +1,255 @@
+"""
+Parallel Expansion: Sharding Seed Corpora Across Processes
+
+Every seed expands independently, so a corpus splits cleanly across
+cores. ParallelExpander copies an (N, 6) seed array into shared memory
+once, cuts it into fixed-size chunks and hands each chunk to a worker
+in a concurrent.futures process pool. The workers read their seeds from
+shared memory and write their shells straight into shared-memory output
+arrays, so only chunk bounds, parameters and block names are pickled.
+The results are copied out of shared memory before the blocks are
+released, so peak memory is twice the size of the output (shared
+blocks cannot be handed out safely: they must be closed while no array
+still views them).
+
+Chunk boundaries depend only on chunk_size, never on the number of
+workers, so the output is bit-for-bit the same with 1 worker or 64 and
+always in input order.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from seed_expansion import expand_seeds_batch
+from seed_exploration import explore_seeds_batch
+
+
+# =============================================================================
+# SHARED OUTPUT BUFFERS
+# =============================================================================
+
+class _SharedArrays:
+    """Named shared-memory blocks backing a set of output arrays."""
+
+    def __init__(self, specs):
+        # specs: {name: (shape, dtype)}
+        self.specs = specs
+        self.blocks = {}
+        try:
+            for name, (shape, dtype) in specs.items():
+                nbytes = max(int(np.prod(shape)) * np.dtype(dtype).itemsize, 1)
+                self.blocks[name] = shared_memory.SharedMemory(create=True, size=nbytes)
+        except BaseException:
+            self.release()
+            raise
+
+    def handles(self):
+        """Picklable (shm name, shape, dtype) per array, for the workers."""
+        return {
+            name: (self.blocks[name].name, shape, np.dtype(dtype).str)
+            for name, (shape, dtype) in self.specs.items()
+        }
+
+    def array(self, name):
+        """View of one array (valid until release())."""
+        shape, dtype = self.specs[name]
+        return np.ndarray(shape, dtype=dtype, buffer=self.blocks[name].buf)
+
+    def copy_out(self, names):
+        """Copy the named arrays into ordinary (process-private) arrays."""
+        return {name: self.array(name).copy() for name in names}
+
+    def release(self):
+        for block in self.blocks.values():
+            block.close()
+            block.unlink()
+        self.blocks = {}
+
+
+def _attach(handles):
+    blocks = {name: shared_memory.SharedMemory(name=shm) for name, (shm, _, _) in handles.items()}
+    arrays = {
+        name: np.ndarray(shape, dtype=dtype, buffer=blocks[name].buf)
+        for name, (_, shape, dtype) in handles.items()
+    }
+    return blocks, arrays
+
+
+# =============================================================================
+# WORKERS
+# =============================================================================
+
+def _expand_chunk(handles, lo, hi, steps, params):
+    blocks, out = _attach(handles)
+    try:
+        S, _, _ = expand_seeds_batch(out['seeds'][lo:hi], steps=steps, **params)
+        out['S'][lo:hi] = S
+    finally:
+        del out
+        for block in blocks.values():
+            block.close()
+
+
+def _explore_chunk(handles, lo, hi, steps, params):
+    blocks, out = _attach(handles)
+    try:
+        S, _, E, mode = explore_seeds_batch(out['seeds'][lo:hi], steps=steps, **params)
+        out['S'][lo:hi] = S
+        out['E'][lo:hi] = E
+        out['mode'][lo:hi] = mode
+    finally:
+        del out
+        for block in blocks.values():
+            block.close()
+
+
+# =============================================================================
+# PARALLEL EXPANDER
+# =============================================================================
+
+class ParallelExpander:
+    """
+    Expand or explore many seeds on a process pool.
+
+    Parameters:
+    -----------
+    max_workers : int, optional
+        Worker processes (default: os.cpu_count())
+    chunk_size : int
+        Seeds per task. Fixes the sharding, so results do not depend
+        on max_workers
+
+    Use as a context manager, or call shutdown() when done; the pool is
+    reused across calls.
+    """
+
+    def __init__(self, max_workers=None, chunk_size=1024):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunk_size = max(int(chunk_size), 1)
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    def shutdown(self):
+        self._pool.shutdown()
+
+    def expand(self, seeds, steps=10, **params):
+        """
+        Parallel expand_seeds_batch.
+
+        Parameters:
+        -----------
+        seeds : array-like, shape (N, 6)
+        steps : int
+        **params
+            E0, r0, rho, epsilon, sigma_scale, dtype (as
+            expand_seeds_batch)
+
+        Returns:
+        --------
+        S : ndarray, shape (N, steps + 1, 6), in dtype (default float64)
+        r : ndarray, shape (steps + 1,)
+        E : ndarray, shape (steps + 1,)
+        """
+        seeds = np.asarray(seeds, dtype=float).reshape(-1, 6)
+        out = self._run(_expand_chunk, seeds, steps, params, {
+            'S': ((len(seeds), steps + 1, 6), params.get('dtype', np.float64)),
+        })
+        # Radii and budgets are shared by all seeds
+        _, r, E = expand_seeds_batch(seeds[:0], steps=steps, **params)
+        return out['S'], r, E
+
+    def explore(self, seeds, steps=10, **params):
+        """
+        Parallel explore_seeds_batch.
+
+        Parameters:
+        -----------
+        seeds : array-like, shape (N, 6)
+        steps : int
+        **params
+            Any explore_seeds_batch keyword (E0, r0, rho, kappa, ...)
+
+        Returns:
+        --------
+        S : ndarray, shape (N, steps + 1, 6)
+        r : ndarray, shape (steps + 1,)
+            Shell radii (shared by all seeds)
+        E : ndarray, shape (N, steps + 1)
+            Per-seed energy budgets (epsilon adapts to each seed)
+        mode : ndarray, shape (N, steps + 1), int8
+            Mode codes, indices into shell_stack.MODES
+        """
+        seeds = np.asarray(seeds, dtype=float).reshape(-1, 6)
+        n = steps + 1
+        out = self._run(_explore_chunk, seeds, steps, params, {
+            'S': ((len(seeds), n, 6), np.float64),
+            'E': ((len(seeds), n), np.float64),
+            'mode': ((len(seeds), n), np.int8),
+        })
+        _, r, _, _ = explore_seeds_batch(seeds[:0], steps=steps, **params)
+        return out['S'], r, out['E'], out['mode']
+
+    def _run(self, worker, seeds, steps, params, specs):
+        # Seeds go into shared memory too; tasks carry only (lo, hi)
+        shared = _SharedArrays({'seeds': (seeds.shape, np.float64), **specs})
+        try:
+            shared.array('seeds')[:] = seeds
+            handles = shared.handles()
+            futures = [
+                self._pool.submit(worker, handles, lo, min(lo + self.chunk_size, len(seeds)),
+                                  steps, params)
+                for lo in range(0, len(seeds), self.chunk_size)
+            ]
+            for future in futures:
+                future.result()  # Re-raises worker errors
+            return shared.copy_out(specs)
+        finally:
+            shared.release()
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("="*60)
+    print("PARALLEL EXPANSION")
+    print("="*60)
+
+    rng = np.random.default_rng(0)
+    seeds = rng.dirichlet(np.ones(6), size=20_000)
+
+    t0 = time.perf_counter()
+    S_ref, _, _ = expand_seeds_batch(seeds, steps=15)
+    t1 = time.perf_counter()
+    print(f"\nSingle process: {len(seeds)} seeds in {t1 - t0:.2f}s")
+
+    results = []
+    for workers in (1, 4):
+        with ParallelExpander(max_workers=workers, chunk_size=2048) as expander:
+            t0 = time.perf_counter()
+            S, r, E = expander.expand(seeds, steps=15)
+            t1 = time.perf_counter()
+        results.append(S)
+        print(f"{workers} worker(s): {t1 - t0:.2f}s")
+
+    deterministic = np.array_equal(results[0], results[1])
+    print(f"\nIdentical across worker counts: {deterministic}")
+    print(f"Max difference vs single batch: {np.max(np.abs(results[0] - S_ref)):.2e}")
+
+    with ParallelExpander(max_workers=2, chunk_size=8) as expander:
+        S, r, E, mode = expander.explore(seeds[:32], steps=10)
+    S_batch, r_batch, _, _ = explore_seeds_batch(seeds[:32], steps=10)
+    match = np.array_equal(S, S_batch) and np.array_equal(r, r_batch)
+    print(f"Explore matches explore_seeds_batch: {match}")
+    print(f"\nStatus: {'PASS' if deterministic and match else 'FAIL'}")
@@ -0,0 +1,295 @@
+"""
+Parameter Sweep: Cached Grids over the Growth Engines
+
+A sweep runs one growth engine over the cartesian product of parameter
+values for a fixed set of seeds. Every grid cell is stored on disk in
+its own directory, one .npy file per column:
+
+    <store>/<key>/S.npy     (N, steps + 1, 6) shell amplitudes
+    <store>/<key>/r.npy     (steps + 1,) radii
+    <store>/<key>/E.npy     energy budgets ((steps + 1,) or (N, steps + 1))
+    <store>/<key>/mode.npy  (N, steps + 1) mode codes (explore only)
+    <store>/<key>/meta.json engine, parameters, steps, seed digest
+
+The key is a hash of the engine, its full parameter set and the seeds,
+so re-running a sweep, or extending its grid, only computes the cells
+that are missing. A cell grown for more steps also serves any shorter
+request (every prefix of a growth is itself a valid growth); a request
+deeper than a stored cell rebuilds that cell from the seeds, since
+explore's running state is not stored with the shells.
+
+Each missing cell runs as its own task on a process pool. The seeds are
+sent to every worker once, when it starts, and W and the envelope
+kernels are memoized, so a worker builds them once for all the cells it
+receives that share them.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from orbital_octa_v2 import grow
+from seed_expansion import expand_seeds_batch
+from seed_exploration import explore_seeds_batch
+
+# Engine parameters, with defaults
+SWEEP_ENGINES = {
+    'expand': {
+        'params': {'E0': 1.0, 'r0': 1.0, 'rho': 1.5, 'epsilon': 0.6, 'sigma_scale': 0.5},
+    },
+    'grow': {
+        'params': {'E0': 1.0, 'r0': 1.0, 'rho': 1.5, 'epsilon': 0.6, 'sigma': 0.5,
+                   'sharpness': 2.0, 'tol': 0.0},
+    },
+    'explore': {
+        'params': {'E0': 1.0, 'r0': 1.0, 'rho': 1.3, 'kappa': 5.0, 'alpha': 0.05,
+                   'beta': 0.25, 'sigma_min': 0.1, 'sigma_max': 0.8, 'gamma': 2.0,
+                   'lambda_prune': 0.2, 'k_threshold': 0.5, 'epsilon_max': 0.95,
+                   'epsilon_min': 0.50},
+    },
+}
+
+
+# =============================================================================
+# STORE
+# =============================================================================
+
+class SweepStore:
+    """
+    On-disk, columnar store of sweep cells.
+
+    Parameters:
+    -----------
+    path : str
+        Directory holding one subdirectory per cell (created if needed)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    def __contains__(self, key):
+        return os.path.exists(os.path.join(self.path, key, 'meta.json'))
+
+    def keys(self):
+        return sorted(key for key in os.listdir(self.path) if key in self)
+
+    def meta(self, key):
+        with open(os.path.join(self.path, key, 'meta.json')) as f:
+            return json.load(f)
+
+    def load(self, key, steps=None, mmap_mode='r'):
+        """
+        Load a cell's columns, truncated to steps + 1 shells if given.
+
+        Columns are memory-mapped by default.
+        """
+        meta = self.meta(key)
+        cell = {'params': meta['params'], 'steps': meta['steps'], 'key': key}
+        for column in meta['columns']:
+            array = np.load(os.path.join(self.path, key, column + '.npy'), mmap_mode=mmap_mode)
+            if steps is not None:
+                # Shell axis is last, except for S where it precedes the 6
+                array = array[..., :steps + 1, :] if column == 'S' else array[..., :steps + 1]
+            cell[column] = array
+        if steps is not None:
+            cell['steps'] = steps
+        return cell
+
+    def save(self, key, meta, columns):
+        """Write a cell atomically (a crashed writer leaves no partial cell)."""
+        tmp = tempfile.mkdtemp(dir=self.path, prefix='.tmp-')
+        try:
+            for column, array in columns.items():
+                np.save(os.path.join(tmp, column + '.npy'), array)
+            with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+                json.dump({**meta, 'columns': list(columns)}, f)
+            final = os.path.join(self.path, key)
+            if os.path.exists(final):
+                shutil.rmtree(final)  # Replaced by a longer growth
+            os.rename(tmp, final)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+    def table(self):
+        """
+        All stored cells as columns: {'key', 'engine', 'steps', <param>...}.
+
+        Parameters an engine does not take are NaN.
+        """
+        keys = self.keys()
+        metas = [self.meta(key) for key in keys]
+        table = {
+            'key': np.array(keys),
+            'engine': np.array([m['engine'] for m in metas]),
+            'steps': np.array([m['steps'] for m in metas]),
+        }
+        names = sorted({name for m in metas for name in m['params']})
+        for name in names:
+            table[name] = np.array([m['params'].get(name, np.nan) for m in metas])
+        return table
+
+
+# =============================================================================
+# SWEEP
+# =============================================================================
+
+def parameter_grid(grid):
+    """
+    Expand {name: values} into a list of parameter dicts (cartesian
+    product, last name varying fastest).
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def cell_key(engine, params, seeds):
+    """Hash identifying one sweep cell (steps excluded, see SweepStore.load)."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({'engine': engine, 'params': params}, sort_keys=True).encode())
+    digest.update(_seed_digest(seeds).encode())
+    return digest.hexdigest()[:32]
+
+
+def sweep(store, grid, seeds, steps=10, engine='expand', max_workers=None):
+    """
+    Run an engine over a parameter grid, computing only missing cells
+    (cells stored with fewer steps are rebuilt at the deeper depth).
+
+    Parameters:
+    -----------
+    store : SweepStore or str
+        Result store (a path opens a SweepStore there)
+    grid : dict
+        {parameter name: list of values}; parameters left out take the
+        engine defaults
+    seeds : array-like, shape (N, 6)
+        Seeds grown at every grid point
+    steps : int
+        Shells to grow beyond the seed
+    engine : str
+        'expand' (expand_seeds_batch), 'grow' (orbital_octa_v2.grow per
+        seed) or 'explore' (explore_seeds_batch)
+    max_workers : int, optional
+        Process pool size; 0 runs in this process
+
+    Returns:
+    --------
+    cells : list of dict
+        One per grid point, in grid order: 'params', 'key', 'steps' and
+        the memory-mapped columns ('S', 'r', 'E', and 'mode' for explore)
+    computed : int
+        Number of cells that had to be computed
+    """
+    if engine not in SWEEP_ENGINES:
+        raise ValueError(f"unknown engine {engine!r}; expected one of {sorted(SWEEP_ENGINES)}")
+    if not isinstance(store, SweepStore):
+        store = SweepStore(store)
+    defaults = SWEEP_ENGINES[engine]['params']
+    unknown = set(grid) - set(defaults)
+    if unknown:
+        raise ValueError(f"unexpected parameters for {engine!r}: {sorted(unknown)}")
+
+    seeds = np.ascontiguousarray(seeds, dtype=float).reshape(-1, 6)
+    points = [{**defaults, **{k: float(v) for k, v in p.items()}} for p in parameter_grid(grid)]
+    keys = [cell_key(engine, params, seeds) for params in points]
+
+    # Missing cells (or stored with fewer shells), deduplicated
+    missing = {}
+    for key, params in zip(keys, points):
+        if key not in missing and (key not in store or store.meta(key)['steps'] < steps):
+            missing[key] = params
+
+    # One task per cell: every engine parallelizes over the grid
+    if max_workers == 0 or len(missing) <= 1:
+        for key, params in missing.items():
+            _run_cell(store.path, engine, key, params, steps, seeds)
+    elif missing:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_set_worker_seeds,
+                                 initargs=(seeds,)) as pool:
+            futures = [pool.submit(_run_cell, store.path, engine, key, params, steps)
+                       for key, params in missing.items()]
+            for future in futures:
+                future.result()
+
+    cells = []
+    for key, params in zip(keys, points):
+        cell = store.load(key, steps)
+        cell['params'] = params
+        cells.append(cell)
+    return cells, len(missing)
+
+
+# Seeds of the sweep, set once per pool worker (see _set_worker_seeds)
+_worker_seeds = None
+
+
+def _set_worker_seeds(seeds):
+    global _worker_seeds
+    _worker_seeds = seeds
+
+
+def _run_cell(path, engine, key, params, steps, seeds=None):
+    # seeds=None: the seeds the pool worker was started with
+    if seeds is None:
+        seeds = _worker_seeds
+    if engine == 'expand':
+        S, r, E = expand_seeds_batch(seeds, steps=steps, **params)
+        columns = {'S': S, 'r': r, 'E': E}
+    elif engine == 'explore':
+        S, r, E, mode = explore_seeds_batch(seeds, steps=steps, **params)
+        columns = {'S': S, 'r': r, 'E': E, 'mode': mode}
+    else:
+        runs = [grow(seed, steps=steps, **params)[0] for seed in seeds]
+        S = np.array([shells.S for shells in runs]).reshape(len(seeds), steps + 1, 6)
+        r, E = (runs[0].r, runs[0].E) if runs else (np.empty(0), np.empty(0))
+        columns = {'S': S, 'r': r, 'E': E}
+    meta = {'engine': engine, 'params': params, 'steps': steps,
+            'n_seeds': len(seeds), 'seeds': _seed_digest(seeds)}
+    SweepStore(path).save(key, meta, columns)
+
+
+def _seed_digest(seeds):
+    return hashlib.sha256(np.ascontiguousarray(seeds, dtype=float).tobytes()).hexdigest()
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    import time
+
+    print("="*60)
+    print("PARAMETER SWEEP")
+    print("="*60)
+
+    store = SweepStore(tempfile.mkdtemp())
+    seeds = np.random.default_rng(0).dirichlet(np.ones(6), size=200)
+    grid = {'sharpness': [1.0, 2.0, 4.0, 8.0], 'rho': [1.3, 1.5]}
+
+    t0 = time.perf_counter()
+    cells, computed = sweep(store, grid, seeds, steps=5, engine='grow')
+    t1 = time.perf_counter()
+    print(f"\nFirst run: {len(cells)} cells, {computed} computed ({t1 - t0:.2f}s)")
+
+    grid['rho'].append(2.0)
+    t0 = time.perf_counter()
+    cells, computed = sweep(store, grid, seeds, steps=5, engine='grow')
+    t1 = time.perf_counter()
+    print(f"Extended grid: {len(cells)} cells, {computed} computed ({t1 - t0:.2f}s)")
+
+    shells, _ = grow(seeds[3], steps=5, sharpness=4.0, rho=2.0)
+    match = np.array_equal(cells[-4]['S'][3], shells.S)
+    print(f"Cell matches direct grow: {match}")
+
+    table = store.table()
+    print(f"Store: {len(table['key'])} cells, columns {sorted(table)}")
+    print(f"\nStatus: {'PASS' if match and computed == 4 else 'FAIL'}")
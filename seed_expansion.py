@@ -1,8 +1,8 @@
-# “””
+"""
 Orbital-Octahedral Fractal Seed: Physics-Compliant Expansion
 
-A compression/decompression scheme where the decompressor doesn’t need
-to be told the rules - it discovers them because they’re the same rules
+A compression/decompression scheme where the decompressor doesn't need
+to be told the rules - it discovers them because they're the same rules
 reality uses.
 
 CORE PRINCIPLE:
@@ -20,400 +20,1086 @@ KEY PROPERTIES:
 The Algorithm:
 
 1. Seed defines proportional amplitudes S = [S_+x, S_-x, S_+y, S_-y, S_+z, S_-z]
-1. Each shell creates a field that influences outer shells
-1. New shells form at energy minima of the total inner field
-1. Proportions are preserved; absolute energy decays with radius
+2. Each shell creates a field that influences outer shells
+3. New shells form at energy minima of the total inner field
+4. Proportions are preserved; absolute energy decays with radius
 
 Author: Jami (Kavik Ulu) - MIT License
-“””
+"""
+
+from functools import lru_cache
 
 import numpy as np
 
-# =============================================================================
+import instrumentation
+from shell_stack import ShellStack, as_arrays
 
-# GEOMETRY: Octahedral Vertices
 
+# =============================================================================
+# GEOMETRY: Octahedral Vertices
 # =============================================================================
 
 U = np.array([
-[1, 0, 0],   # 0: +X
-[-1, 0, 0],  # 1: -X
-[0, 1, 0],   # 2: +Y
-[0, -1, 0],  # 3: -Y
-[0, 0, 1],   # 4: +Z
-[0, 0, -1]   # 5: -Z
+    [1, 0, 0],   # 0: +X
+    [-1, 0, 0],  # 1: -X
+    [0, 1, 0],   # 2: +Y
+    [0, -1, 0],  # 3: -Y
+    [0, 0, 1],   # 4: +Z
+    [0, 0, -1]   # 5: -Z
 ], dtype=float)
 
-# =============================================================================
 
+# =============================================================================
 # CORE EQUATIONS
-
 # =============================================================================
 
 def influence_weight(u_i, u_j):
-“””
-Angular influence of direction j on direction i.
+    """
+    Angular influence of direction j on direction i.
 
-```
-W_ij = max(0, u_i · u_j)
+    W_ij = max(0, u_i · u_j)
+
+    Physical meaning: field from direction j only influences
+    direction i if they point in compatible directions.
+    Opposite directions have zero influence.
+    """
+    return max(0.0, np.dot(u_i, u_j))
 
-Physical meaning: field from direction j only influences 
-direction i if they point in compatible directions.
-Opposite directions have zero influence.
-"""
-return max(0.0, np.dot(u_i, u_j))
-```
 
 def radial_envelope(r_shell, r_sample, sigma_scale=0.5):
-“””
-Radial influence of shell at r_shell on point at r_sample.
+    """
+    Radial influence of shell at r_shell on point at r_sample.
 
-```
-f(r) = exp(-(r_sample - r_shell)² / (2σ²))
+    f(r) = exp(-(r_sample - r_shell)² / (2σ²))
 
-where σ = sigma_scale × r_shell
+    where σ = sigma_scale × r_shell
+
+    Sigma scales with radius so influence range is proportional
+    to distance from origin. This ensures consistent behavior
+    across all scales.
+    """
+    sigma = sigma_scale * r_shell
+    return np.exp(-((r_sample - r_shell)**2) / (2 * sigma**2))
 
-Sigma scales with radius so influence range is proportional
-to distance from origin. This ensures consistent behavior
-across all scales.
-"""
-sigma = sigma_scale * r_shell
-return np.exp(-((r_sample - r_shell)**2) / (2 * sigma**2))
-```
 
 def field_contribution(S, r_shell, r_sample, sigma_scale=0.5):
-“””
-Field contribution from shell with amplitudes S at radius r_shell,
-evaluated at radius r_sample.
+    """
+    Field contribution from shell with amplitudes S at radius r_shell,
+    evaluated at radius r_sample.
 
-```
-Φ_shell(r) = S × f(r)
+    Φ_shell(r) = S × f(r)
+
+    Returns 6-vector of field values at each octahedral direction.
+    """
+    f_r = radial_envelope(r_shell, r_sample, sigma_scale)
+    return S * f_r
 
-Returns 6-vector of field values at each octahedral direction.
-"""
-f_r = radial_envelope(r_shell, r_sample, sigma_scale)
-return S * f_r
-```
 
 def total_field(shells, r_sample, W, sigma_scale=0.5):
-“””
-Total field at r_sample from all inner shells.
+    """
+    Total field at r_sample from all inner shells.
 
-```
-Φ_total(r) = Σ_shells W @ Φ_shell(r)
+    Φ_total(r) = Σ_shells W @ Φ_shell(r)
 
-where W is the angular influence matrix.
-Only shells with r < r_sample contribute (causality).
-"""
-field = np.zeros(6)
-for shell in shells:
-    if shell['r'] >= r_sample:
-        continue  # Causality: only inner shells contribute
-    contrib = field_contribution(
-        shell['S'], shell['r'], r_sample, sigma_scale
-    )
-    field += W @ contrib
-return field
-```
+    where W is the angular influence matrix (or its diagonal form,
+    see influence_operator).
+    Only shells with r < r_sample contribute (causality).
+    """
+    r, S = as_arrays(shells)
+    return total_field_arrays(r, S, r_sample, W, sigma_scale)
 
-# =============================================================================
 
-# ENERGY CONSERVATION
+def total_field_arrays(r, S, r_sample, W, sigma_scale=0.5):
+    """
+    Total field at r_sample from shells stored as contiguous arrays.
 
-# =============================================================================
+    r : (n,) shell radii
+    S : (n, 6) shell amplitudes
 
-def normalize_to_energy(v, E, eps=1e-12):
-“””
-Normalize amplitude vector to total energy E.
+    W is linear, so the angular coupling is applied once to the
+    radially weighted sum instead of once per shell:
 
-```
-S_normalized = S × (E / Σ S_i)
+    Φ_total(r) = W @ Σ_shells S_i × f(r_i, r)
+
+    One vectorized reduction replaces the per-shell Python loop.
+    """
+    inner = r < r_sample  # Causality: only inner shells contribute
+    f_r = radial_envelope(r[inner], r_sample, sigma_scale)
+    return apply_influence(W, f_r @ S[inner])
 
-Ensures Σ S_i = E exactly.
-Non-negative constraint enforced.
-"""
-v = np.maximum(v, 0.0)
-total = v.sum()
-if total < eps:
-    # Uniform distribution if no field
-    return np.ones(6) * (E / 6)
-return v * (E / total)
-```
 
+# =============================================================================
+# ENVELOPE KERNEL TABLE
 # =============================================================================
 
-# SHELL FORMATION
+# exp(-x) underflows to exactly 0.0 in float64 beyond this exponent
+ENVELOPE_UNDERFLOW = 746.0
 
-# =============================================================================
+# Kernel tables longer than this are capped to the taps a run needs
+# (open-ended streams lengthen theirs as their history grows)
+KERNEL_MAX_TAPS = 1 << 16
 
-def build_influence_matrix():
-“””
-Build 6×6 angular influence matrix.
 
-```
-W[i,j] = influence of direction j on direction i
+def envelope_kernel_length(rho, sigma_scale=0.5, tol=0.0):
+    """
+    Number of non-negligible taps in the envelope kernel.
 
-For octahedral geometry:
-- W[i,i] = 1 (self-influence maximum)
-- W[i,j] = 0 if u_i · u_j ≤ 0 (orthogonal or opposite)
+    Tap k is dropped once (ρ^k - 1)² / (2σ²) exceeds -ln(tol), or the
+    float64 underflow exponent when tol = 0.
+    """
+    if rho <= 1:
+        return 0
+    x_max = -np.log(tol) if tol > 0 else ENVELOPE_UNDERFLOW
+    reach = np.log1p(sigma_scale * np.sqrt(2 * x_max)) / np.log(rho)
+    return max(int(np.ceil(reach)), 0)
 
-Rows normalized to sum to 1.
-"""
-W = np.zeros((6, 6))
-for i in range(6):
-    for j in range(6):
-        W[i, j] = influence_weight(U[i], U[j])
-    # Normalize row
-    row_sum = W[i].sum()
-    if row_sum > 0:
-        W[i] /= row_sum
-return W
-```
 
-def form_shell(shells, r_new, E_new, W, sigma_scale=0.5):
-“””
-Form new shell at radius r_new with energy budget E_new.
+def envelope_kernel(rho, sigma_scale=0.5, tol=0.0, max_taps=None):
+    """
+    Radial envelope coefficients for a geometric shell lattice.
 
-```
-1. Sample total field from inner shells at r_new
-2. Normalize to energy budget
+    With r_n = r0 × ρ^n and σ = sigma_scale × r_i, the influence of
+    shell i on shell n depends only on k = n - i:
 
-New shell settles into energy landscape created by inner shells.
-"""
-if len(shells) == 0:
-    return np.ones(6) * (E_new / 6)
+    g_k = f(r_i, r_n) = exp(-(ρ^k - 1)² / (2 × sigma_scale²)),  k ≥ 1
 
-field = total_field(shells, r_new, W, sigma_scale)
-return normalize_to_energy(field, E_new)
-```
+    independent of r0. Returns g_1..g_K as a cached read-only array,
+    truncated where coefficients fall below tol (tol = 0 keeps every
+    coefficient that does not underflow to exactly 0, so the banded
+    sum equals the full sum). max_taps caps the length for lattices
+    that decay slowly (ρ close to 1).
 
-# =============================================================================
+    For ρ ≤ 1 no shell is inside the next one and the kernel is empty.
+    """
+    taps = envelope_kernel_length(rho, sigma_scale, tol)
+    if max_taps is not None:
+        taps = min(taps, max_taps)
+    return _envelope_kernel(float(rho), float(sigma_scale), float(tol), taps)
 
-# GROWTH ALGORITHM
 
-# =============================================================================
+@lru_cache(maxsize=64)
+def _envelope_kernel(rho, sigma_scale, tol, taps):
+    k = np.arange(1, taps + 1)
+    g = np.exp(-(np.expm1(k * np.log(rho))**2) / (2 * sigma_scale**2))
+    g = g[(g > 0) & (g >= tol)]
+    g.flags.writeable = False
+    return g
 
-def expand_seed(seed, E0=1.0, r0=1.0, steps=10, rho=1.5, epsilon=0.6,
-sigma_scale=0.5):
-“””
-Expand seed into shell structure.
-
-```
-Parameters:
------------
-seed : array-like, length 6
-    Initial proportional amplitudes [+X, -X, +Y, -Y, +Z, -Z]
-E0 : float
-    Initial energy budget
-r0 : float  
-    Initial radius
-steps : int
-    Number of shells to grow (beyond seed)
-rho : float
-    Radial scaling factor: r_{n+1} = ρ × r_n
-epsilon : float
-    Energy decay factor: E_{n+1} = ε × E_n
-sigma_scale : float
-    Radial influence width as fraction of shell radius
-
-Returns:
---------
-shells : list of dicts
-    Each shell has 'id', 'r', 'E', 'S'
-"""
-W = build_influence_matrix()
-
-# Seed becomes shell 0
-shells = [{
-    'id': 0,
-    'r': r0,
-    'E': E0,
-    'S': normalize_to_energy(np.array(seed, dtype=float), E0)
-}]
-
-# Grow additional shells
-for n in range(steps):
-    r_new = rho * shells[-1]['r']
-    E_new = epsilon * shells[-1]['E']
-    S_new = form_shell(shells, r_new, E_new, W, sigma_scale)
-    shells.append({
-        'id': n + 1,
-        'r': r_new,
-        'E': E_new,
-        'S': S_new
-    })
-
-return shells
-```
 
-def compress_to_seed(shells):
-“””
-Extract seed from shell structure.
+def _kernel_as(g, dtype):
+    # Taps that underflow in a narrower dtype are exactly 0 there, so
+    # they are dropped (g decreases, leaving a prefix)
+    if g.dtype == dtype:
+        return g
+    g = g.astype(dtype)
+    return g[:np.count_nonzero(g)]
+
+
+def total_field_kernel(S, g, W):
+    """
+    Total field at the next shell of a geometric lattice.
+
+    S : (n, ...) amplitudes of the shells grown so far, innermost first;
+        trailing axes may hold a batch, e.g. (n, N, 6)
+    g : envelope kernel for the lattice (see envelope_kernel)
+
+    Φ_total(r_n) = W @ Σ_k g_k × S_{n-k},  k = 1..min(n, K)
+
+    A banded dot product over the last K shells only.
+    """
+    m = min(len(g), len(S))
+    window = S[len(S) - m:][::-1]  # Newest shell first, matching g_1..g_m
+    return apply_influence(W, np.tensordot(g[:m], window, axes=1))
 
-```
-Returns proportional amplitudes (normalized to sum to 1).
-"""
-S0 = shells[0]['S']
-return S0 / S0.sum()
-```
 
+# =============================================================================
+# TRUNCATED HORIZON
 # =============================================================================
 
-# MINIMAL SEED FORMAT
+def envelope_reach(sigma_scale=0.5, tol=0.0):
+    """
+    Largest relative gap (r_sample / r_shell - 1) with envelope ≥ tol.
+
+    tol = 0 uses the float64 underflow point, where dropping a shell
+    changes nothing.
+    """
+    x_max = -np.log(tol) if tol > 0 else ENVELOPE_UNDERFLOW
+    return sigma_scale * np.sqrt(2 * x_max)
+
+
+def horizon_start(r, r_sample, sigma_scale=0.5, tol=0.0):
+    """
+    Index of the innermost shell that still matters at r_sample.
+
+    r must be increasing. Shells before the returned index have
+    radial_envelope(r_i, r_sample) < tol and can be skipped.
+    """
+    r_min = r_sample / (1 + envelope_reach(sigma_scale, tol))
+    return int(np.searchsorted(r, r_min, side='left'))
+
+
+def influence_norm(W):
+    """
+    Largest L1 gain of W (maximum absolute column sum).
+
+    ||W @ x||_1 ≤ influence_norm(W) × ||x||_1, for the matrix or its
+    diagonal form.
+    """
+    if W.ndim == 1:
+        return float(np.max(np.abs(W)))
+    return float(np.max(np.abs(W).sum(axis=0)))
+
+
+def kernel_error_bound(field, err, E, g, g_tail, w_norm, E_new, eps=1e-12):
+    """
+    L1 error bound for a shell formed from a truncated envelope kernel.
+
+    field  : field actually used for the new shell (kept taps only)
+    err, E : (n,) L1 error bounds and energies of the shells so far
+    g      : kept kernel taps g_1..g_K
+    g_tail : dropped taps g_{K+1}.. (see envelope_kernel with tol=0)
+
+    The exact field differs from the kept one by at most
+        Δ = ||W|| × (Σ_kept g_k × err_{n-k} + Σ_dropped g_k × E_{n-k})
+    (exact shells satisfy ||S||_1 = E), and normalizing to E_new maps a
+    field error Δ to at most 2 × E_new × Δ / ||field||_1. Errors on inner
+    shells are carried forward through the kept taps.
+    """
+    n = len(E)
+    m = min(len(g), n)
+    kept = g[:m] @ err[n - m:n][::-1]
+    t = min(len(g_tail), n - m)
+    dropped = g_tail[:t] @ E[n - m - t:n - m][::-1]
+    total = np.maximum(field, 0.0).sum()
+    if total < eps:
+        return 2 * E_new
+    return min(2 * E_new * w_norm * (kept + dropped) / total, 2 * E_new)
+
 
+# =============================================================================
+# ENERGY CONSERVATION
 # =============================================================================
 
-def encode_seed_binary(proportions, bits_per_value=8):
-“””
-Encode 6 proportional values to binary.
+def normalize_to_energy(v, E, eps=1e-12, dtype=None):
+    """
+    Normalize amplitude vector to total energy E.
+
+    S_normalized = S × (E / Σ S_i)
+
+    Ensures Σ S_i = E exactly.
+    Non-negative constraint enforced.
+
+    v may also be a stack of vectors with shape (..., 6); each row is
+    normalized independently, to the same E or to per-row budgets
+    given as an array broadcastable to (..., 1).
+
+    The result has the given dtype, or v's floating dtype by default
+    (float64 for any other input).
+    """
+    if dtype is None:
+        dtype = v.dtype if isinstance(v, np.ndarray) and v.dtype.kind == 'f' else np.float64
+    v = np.maximum(np.asarray(v, dtype=dtype), 0.0)
+    if v.ndim > 1:
+        total = v.sum(axis=-1, keepdims=True)
+        empty = total < eps
+        # Uniform distribution if no field
+        S = np.where(empty, E / 6, v * (E / np.where(empty, 1.0, total)))
+        return S.astype(dtype, copy=False)
+    total = v.sum()
+    if total < eps:
+        # Uniform distribution if no field
+        return np.full(6, E / 6, dtype=dtype)
+    return (v * (E / total)).astype(dtype, copy=False)
 
-```
-Since proportions sum to 1, we only need to store 5 values.
-The 6th is implicit: p_6 = 1 - Σ p_1..5
 
-With 8 bits per value, total = 40 bits = 5 bytes
-"""
-# Validate
-proportions = np.array(proportions)
-proportions = proportions / proportions.sum()  # Normalize
-
-# Encode first 5 values
-max_val = (1 << bits_per_value) - 1
-encoded = []
-for i in range(5):
-    # Clamp and quantize
-    val = int(proportions[i] * max_val)
-    val = max(0, min(max_val, val))
-    encoded.append(val)
-
-return encoded
-```
+# =============================================================================
+# SHELL FORMATION
+# =============================================================================
 
-def decode_seed_binary(encoded, bits_per_value=8):
-“””
-Decode binary to 6 proportional values.
-“””
-max_val = (1 << bits_per_value) - 1
+@lru_cache(maxsize=4)
+def build_influence_matrix(dtype=np.float64):
+    """
+    Build 6×6 angular influence matrix.
+
+    W[i,j] = influence of direction j on direction i
+
+    For octahedral geometry:
+    - W[i,i] = 1 (self-influence maximum)
+    - W[i,j] = 0 if u_i · u_j ≤ 0 (orthogonal or opposite)
+
+    Rows normalized to sum to 1.
+
+    Computed once from U (W_ij = max(0, u_i · u_j) for all pairs at
+    once) and cached per dtype; the returned array is read-only and
+    shared.
+    """
+    W = np.maximum(U @ U.T, 0.0)
+    # Normalize rows
+    row_sum = W.sum(axis=1, keepdims=True)
+    W = (W / np.where(row_sum > 0, row_sum, 1.0)).astype(dtype)
+    W.flags.writeable = False
+    return W
+
+
+@lru_cache(maxsize=4)
+def influence_operator(dtype=np.float64):
+    """
+    Cheapest equivalent form of W for apply_influence().
+
+    For the octahedron every off-diagonal weight vanishes (orthogonal
+    and opposite directions have u_i · u_j ≤ 0), so W is diagonal and
+    the 6×6 matmul reduces to an elementwise product with its diagonal.
+    Returns that diagonal as a read-only 6-vector, or W itself if the
+    geometry ever yields off-diagonal coupling.
+    """
+    W = build_influence_matrix(dtype)
+    if np.count_nonzero(W - np.diag(np.diag(W))):
+        return W
+    d = np.diag(W).copy()
+    d.flags.writeable = False
+    return d
+
+
+def apply_influence(W, field):
+    """
+    Apply the angular influence W to a field of shape (..., 6).
+
+    W may be the full 6×6 matrix or its diagonal form (a 6-vector,
+    see influence_operator); both give W @ field for each row.
+    """
+    if W.ndim == 1:
+        return field * W
+    return field @ W.T
 
-```
-proportions = []
-for val in encoded:
-    proportions.append(val / max_val)
 
-# 6th value is remainder
-remainder = 1.0 - sum(proportions)
-proportions.append(max(0.0, remainder))
+def form_shell(shells, r_new, E_new, W, sigma_scale=0.5):
+    """
+    Form new shell at radius r_new with energy budget E_new.
 
-# Re-normalize to handle quantization errors
-total = sum(proportions)
-return [p / total for p in proportions]
-```
+    1. Sample total field from inner shells at r_new
+    2. Normalize to energy budget
 
-# =============================================================================
+    New shell settles into energy landscape created by inner shells.
+    """
+    if len(shells) == 0:
+        return np.ones(6) * (E_new / 6)
+
+    field = total_field(shells, r_new, W, sigma_scale)
+    return normalize_to_energy(field, E_new)
 
-# VERIFICATION
 
+# =============================================================================
+# GROWTH ALGORITHM
 # =============================================================================
 
-def verify_expansion(seed, steps=20):
-“””
-Verify that expansion preserves seed structure.
-“””
-seed = np.array(seed)
-seed_normalized = seed / seed.sum()
-
-```
-shells = expand_seed(seed, steps=steps)
-
-print("Verifying structure preservation:")
-print(f"Seed proportions: {np.round(seed_normalized, 4)}")
-print()
-
-max_deviation = 0.0
-for s in shells:
-    S_prop = s['S'] / s['S'].sum()
-    deviation = np.max(np.abs(S_prop - seed_normalized))
-    max_deviation = max(max_deviation, deviation)
-    
-    if s['id'] <= 5 or s['id'] == steps:
-        print(f"Shell {s['id']:2d}: {np.round(S_prop, 4)} (dev: {deviation:.2e})")
-
-print(f"\nMax deviation across all shells: {max_deviation:.2e}")
-print(f"Structure preserved: {'YES' if max_deviation < 1e-10 else 'NO'}")
-
-return max_deviation < 1e-10
-```
+def expand_seed(seed, E0=1.0, r0=1.0, steps=10, rho=1.5, epsilon=0.6,
+                sigma_scale=0.5, tol=0.0, dtype=np.float64, lazy=False):
+    """
+    Expand seed into shell structure.
+
+    Parameters:
+    -----------
+    seed : array-like, length 6
+        Initial proportional amplitudes [+X, -X, +Y, -Y, +Z, -Z]
+    E0 : float
+        Initial energy budget
+    r0 : float
+        Initial radius
+    steps : int
+        Number of shells to grow (beyond seed)
+    rho : float
+        Radial scaling factor: r_{n+1} = ρ × r_n
+    epsilon : float
+        Energy decay factor: E_{n+1} = ε × E_n
+    sigma_scale : float
+        Radial influence width as fraction of shell radius
+    tol : float
+        Opt-in horizon: skip inner-shell contributions whose envelope
+        is below tol. 0 (default) only skips exact-zero contributions.
+    dtype : numpy dtype
+        Working precision. np.float32 halves memory traffic at the cost
+        of rounding drift; see precision_drift to measure it.
+    lazy : bool
+        Return an Expansion that grows shells only as they are indexed
+        (steps then caps the depth; None leaves it open)
+
+    Returns:
+    --------
+    shells : ShellStack (or Expansion if lazy)
+        Contiguous r, E, S arrays; indexing/iteration yields dicts
+        with 'id', 'r', 'E', 'S'. shells.error_bound holds the maximum
+        amplitude error the horizon can induce on any shell (0.0 when
+        tol = 0); shells.params records the growth parameters (see
+        checkpoint.save_checkpoint).
+    """
+    if lazy:
+        return Expansion(seed, E0, r0, steps, rho, epsilon, sigma_scale, tol, dtype)
+
+    # Seed becomes shell 0
+    shells = ShellStack(capacity=steps + 1, dtype=dtype)
+    shells.params = {'engine': 'expand', 'rho': rho, 'epsilon': epsilon,
+                     'sigma_scale': sigma_scale, 'tol': tol}
+    shells.append(r0, E0, normalize_to_energy(np.array(seed, dtype=float), E0, dtype=dtype))
+
+    # Grow additional shells
+    err_max = 0.0
+    for r, E, S, err in _expansion_steps(r0, shells.E, shells.S, np.zeros(1),
+                                         steps, rho, epsilon, sigma_scale, tol, dtype):
+        shells.append(r, E, S, error=err / 2)
+        err_max = max(err_max, err)
+
+    # Both shells sum to E, so max |ΔS_i| ≤ ||ΔS||_1 / 2
+    shells.error_bound = err_max / 2
+    return shells
+
+
+def iter_expand(seed, E0=1.0, r0=1.0, steps=10, rho=1.5, epsilon=0.6,
+                sigma_scale=0.5, tol=0.0, dtype=np.float64):
+    """
+    Generator counterpart of expand_seed.
+
+    Yields shells one at a time as dicts with 'id', 'r', 'E', 'S' and
+    'error' (amplitude error bound from the horizon, 0.0 when tol = 0).
+    Only the trailing kernel window of shells is held for future field
+    evaluation, so memory stays flat however deep the expansion goes.
+    The consumer can stop at any shell - every shell is already a valid
+    stable state.
+
+    steps=None keeps growing until the consumer stops.
+    """
+    S0 = normalize_to_energy(np.array(seed, dtype=float), E0, dtype=dtype)
+    steps_iter = _expansion_steps(r0, np.array([E0]), S0[None], np.zeros(1),
+                                  steps, rho, epsilon, sigma_scale, tol, dtype)
+    return _shell_dicts(r0, E0, S0, steps_iter)
+
+
+def _shell_dicts(r0, E0, S0, steps_iter):
+    yield {'id': 0, 'r': r0, 'E': E0, 'S': S0, 'error': 0.0}
+    for n, (r, E, S, err) in enumerate(steps_iter, start=1):
+        yield {'id': n, 'r': float(r), 'E': float(E), 'S': S.copy(), 'error': err / 2}
+
+
+class Expansion:
+    """
+    Lazily grown expansion of a seed (see expand_seed(lazy=True)).
+
+    Shells are computed the first time they are needed and kept:
+    exp[k] grows shells up to k, and a later exp[k + m] continues from
+    there instead of starting over. Causality makes the grown prefix
+    final, so the shells equal those of expand_seed exactly.
+
+    exp[k]     -> shell dict, as ShellStack indexing
+    exp[i:j]   -> ShellStack view of the grown shells (shares memory)
+    iter(exp)  -> shell dicts, growing as the iteration advances
+
+    Negative indices and len() need a finite depth (steps).
+
+    Attributes:
+    -----------
+    shells : ShellStack
+        The shells grown so far
+    steps : int or None
+        Depth cap (shells 0..steps)
+    """
+
+    def __init__(self, seed, E0=1.0, r0=1.0, steps=10, rho=1.5, epsilon=0.6,
+                 sigma_scale=0.5, tol=0.0, dtype=np.float64):
+        self.steps = steps
+        self.shells = ShellStack(capacity=16 if steps is None else steps + 1, dtype=dtype)
+        self.shells.params = {'engine': 'expand', 'rho': rho, 'epsilon': epsilon,
+                              'sigma_scale': sigma_scale, 'tol': tol}
+        self.shells.append(r0, E0, normalize_to_energy(np.array(seed, dtype=float), E0,
+                                                       dtype=dtype))
+        self._err_max = 0.0
+        self._steps = _expansion_steps(r0, self.shells.E, self.shells.S, np.zeros(1),
+                                       steps, rho, epsilon, sigma_scale, tol, dtype)
+
+    @property
+    def materialized(self):
+        """Number of shells grown so far."""
+        return len(self.shells)
+
+    @property
+    def error_bound(self):
+        """Amplitude error bound over the shells grown so far."""
+        return self.shells.error_bound
+
+    def materialize(self, k):
+        """Grow shells up to index k (capped at steps); returns the shells."""
+        if self.steps is not None:
+            k = min(k, self.steps)
+        for _ in range(k + 1 - len(self.shells)):
+            r, E, S, err = next(self._steps)
+            self.shells.append(r, E, S, error=err / 2)
+            self._err_max = max(self._err_max, err)
+            self.shells.error_bound = self._err_max / 2
+        return self.shells
+
+    def __len__(self):
+        if self.steps is None:
+            raise TypeError("an open-ended Expansion has no length")
+        return self.steps + 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if self.steps is None:
+                if index.stop is None or index.stop < 0 or (index.start or 0) < 0:
+                    raise ValueError("open-ended Expansion slices need explicit, "
+                                     "non-negative bounds")
+                self.materialize(index.stop - 1)
+                return self.shells[index]
+            start, stop, step = index.indices(len(self))
+            indices = range(start, stop, step)
+            if len(indices):
+                self.materialize(max(indices[0], indices[-1]))
+            return self.shells[index]
+        if index < 0:
+            index += len(self)
+        if index < 0 or (self.steps is not None and index > self.steps):
+            raise IndexError("shell index out of range")
+        return self.materialize(index)[index]
+
+    def __iter__(self):
+        k = 0
+        while self.steps is None or k <= self.steps:
+            yield self.materialize(k)[k]
+            k += 1
+
+    def __repr__(self):
+        depth = 'open' if self.steps is None else self.steps + 1
+        return f"Expansion(materialized={len(self.shells)}, depth={depth})"
+
+
+@instrumentation.with_recorder
+def _expansion_steps(r, E_hist, S_hist, err_hist, steps, rho, epsilon,
+                     sigma_scale, tol, dtype=np.float64, recorder=None):
+    """
+    Core growth loop shared by expand_seed and iter_expand.
+
+    r : radius of the last shell grown
+    E_hist, S_hist, err_hist : energies, amplitudes and L1 error bounds
+        of the shells grown so far (only the trailing kernel window is
+        read)
+    steps : number of shells to grow, or None to continue indefinitely
+    dtype : working precision of the buffers, kernel and W
+
+    Yields (r, E, S, err) for each new shell; S is a view into a
+    buffer that is reused, so copy it to keep it.
+    """
+    W = influence_operator(dtype)
+
+    def kernels(max_taps):
+        g_full = _kernel_as(envelope_kernel(rho, sigma_scale, max_taps=max_taps), dtype)
+        g = g_full
+        if tol > 0:
+            g = _kernel_as(envelope_kernel(rho, sigma_scale, tol, max_taps=max_taps), dtype)
+        return g_full, g, g_full[len(g):]
+
+    # An open-ended run starts from a capped kernel and lengthens it
+    # once enough shells exist for the dropped taps to matter
+    max_taps = max(len(E_hist), KERNEL_MAX_TAPS)
+    if steps is not None:
+        max_taps = max(steps + len(E_hist), KERNEL_MAX_TAPS)
+    g_full, g, g_tail = kernels(max_taps)
+    true_taps = envelope_kernel_length(rho, sigma_scale)
+    w_norm = influence_norm(W)
+
+    # Buffer holds the last `window` shells; compacted when full
+    window = max(len(g_full), 1)
+    E_buf = np.empty(2 * window, dtype=dtype)
+    S_buf = np.empty((2 * window, 6), dtype=dtype)
+    err_buf = np.empty(2 * window, dtype=dtype)
+
+    count = min(len(E_hist), window)
+    E_buf[:count] = E_hist[len(E_hist) - count:]
+    S_buf[:count] = S_hist[len(S_hist) - count:]
+    err_buf[:count] = err_hist[len(err_hist) - count:]
+
+    rec = recorder
+    n = 0
+    while steps is None or n < steps:
+        if rec is not None:
+            rec.lap('expand')
+        if count > len(g_full) and len(g_full) == max_taps < true_taps:
+            # The capped kernel would miss a shell: lengthen it. Buffers
+            # are only compacted past the window, so all shells are kept
+            max_taps = min(2 * max_taps, true_taps)
+            g_full, g, g_tail = kernels(max_taps)
+            window = max(len(g_full), 1)
+            if 2 * window > len(E_buf):
+                E_buf = np.concatenate([E_buf[:count], np.empty(2 * window - count, dtype=dtype)])
+                S_buf = np.concatenate([S_buf[:count],
+                                        np.empty((2 * window - count, 6), dtype=dtype)])
+                err_buf = np.concatenate([err_buf[:count],
+                                          np.empty(2 * window - count, dtype=dtype)])
+        if count == len(E_buf):
+            E_buf[:window] = E_buf[count - window:]
+            S_buf[:window] = S_buf[count - window:]
+            err_buf[:window] = err_buf[count - window:]
+            count = window
+
+        r = rho * r
+        E_new = epsilon * E_buf[count - 1]
+        field = total_field_kernel(S_buf[:count], g, W)
+        if rec is not None:
+            rec.count('field_evals')
+            rec.count('kernel_taps', min(len(g), count))
+            rec.count('contractions')
+            rec.count('influence_apply')
+            rec.tick('field')
+        err = 0.0
+        if tol > 0:
+            err = kernel_error_bound(
+                field, err_buf[:count], E_buf[:count], g, g_tail, w_norm, E_new
+            )
+            if rec is not None:
+                rec.tick('error_bound')
+
+        E_buf[count] = E_new
+        S_buf[count] = normalize_to_energy(field, E_new)
+        err_buf[count] = err
+        count += 1
+        n += 1
+        if rec is not None:
+            rec.tick('normalize')
+            rec.shell(n, r, E_new, S_buf[count - 1], err)
+        yield r, E_new, S_buf[count - 1], err
+
+
+def expand_seeds_batch(seeds, E0=1.0, r0=1.0, steps=10, rho=1.5,
+                       epsilon=0.6, sigma_scale=0.5, dtype=np.float64):
+    """
+    Expand many seeds in lockstep.
+
+    All seeds share the same radii and energy budgets, so the envelope
+    kernel is shared and the field for every seed is a single banded
+    contraction over the inner shells followed by one application of W.
+
+    Parameters:
+    -----------
+    seeds : array-like, shape (N, 6)
+        Proportional amplitudes, one seed per row
+    E0, r0, steps, rho, epsilon, sigma_scale, dtype :
+        As for expand_seed
+
+    Returns:
+    --------
+    S : ndarray, shape (N, steps + 1, 6)
+        Shell amplitudes for every seed; S[i] matches
+        expand_seed(seeds[i])[n]['S'] for each shell n
+    r : ndarray, shape (steps + 1,)
+        Shell radii (shared by all seeds)
+    E : ndarray, shape (steps + 1,)
+        Shell energy budgets (shared by all seeds)
+    """
+    for r, E, S, _ in iter_seeds_batch(seeds, E0, r0, steps, rho, epsilon, sigma_scale, dtype):
+        pass
+    return np.ascontiguousarray(S.transpose(1, 0, 2)), r, E
+
+
+def iter_seeds_batch(seeds, E0=1.0, r0=1.0, steps=10, rho=1.5,
+                     epsilon=0.6, sigma_scale=0.5, dtype=np.float64):
+    """
+    Generator counterpart of expand_seeds_batch, one shell at a time.
+
+    Yields (r, E, S, n) once shell n is formed for every seed, seed
+    shell included: r, E (steps + 1,) and the shell-major S
+    (steps + 1, N, 6) are the full output buffers, valid up to n. Shells
+    already yielded are never rewritten, so consumers can send them on
+    while the later ones grow.
+    """
+    W = influence_operator(dtype)
+    g = _kernel_as(envelope_kernel(rho, sigma_scale, max_taps=max(steps, KERNEL_MAX_TAPS)), dtype)
+    seeds = np.asarray(seeds, dtype=dtype).reshape(-1, 6)
+
+    r = np.empty(steps + 1, dtype=dtype)
+    E = np.empty(steps + 1, dtype=dtype)
+    # Shell-major while growing so the inner shells are contiguous
+    S = np.empty((steps + 1, len(seeds), 6), dtype=dtype)
+
+    r[0] = r0
+    E[0] = E0
+    S[0] = normalize_to_energy(seeds, E0)
+    yield r, E, S, 0
+
+    for n in range(1, steps + 1):
+        r[n] = rho * r[n - 1]
+        E[n] = epsilon * E[n - 1]
+        field = total_field_kernel(S[:n], g, W)
+        S[n] = normalize_to_energy(field, E[n])
+        yield r, E, S, n
 
-# =============================================================================
 
-# DEMO
+def compress_to_seed(shells):
+    """
+    Extract seed from shell structure.
+
+    Returns proportional amplitudes (normalized to sum to 1).
+    """
+    S0 = shells[0]['S']
+    return S0 / S0.sum()
 
+
+# =============================================================================
+# MINIMAL SEED FORMAT
 # =============================================================================
 
-if **name** == “**main**”:
-print(”=”*60)
-print(“PHYSICS-COMPLIANT SEED EXPANSION”)
-print(”=”*60)
+def encode_seed_binary(proportions, bits_per_value=8):
+    """
+    Encode 6 proportional values to binary.
+
+    Since proportions sum to 1, we only need to store 5 values.
+    The 6th is implicit: p_6 = 1 - Σ p_1..5
+
+    With 8 bits per value, total = 40 bits = 5 bytes
+    """
+    # Validate
+    proportions = np.array(proportions)
+    proportions = proportions / proportions.sum()  # Normalize
+
+    # Encode first 5 values
+    max_val = (1 << bits_per_value) - 1
+    encoded = []
+    for i in range(5):
+        # Clamp and quantize
+        val = int(proportions[i] * max_val)
+        val = max(0, min(max_val, val))
+        encoded.append(val)
 
-```
-# Define a seed
-seed = [0.5, 0.2, 0.15, 0.08, 0.05, 0.02]
+    return encoded
 
-print(f"\nSeed: {seed}")
-print(f"Interpretation: Strong +X bias, moderate -X and +Y")
 
-# Expand
-print("\n" + "-"*60)
-print("EXPANDING...")
-print("-"*60)
+def decode_seed_binary(encoded, bits_per_value=8):
+    """
+    Decode binary to 6 proportional values.
+    """
+    max_val = (1 << bits_per_value) - 1
+
+    proportions = []
+    for val in encoded:
+        proportions.append(val / max_val)
+
+    # 6th value is remainder
+    remainder = 1.0 - sum(proportions)
+    proportions.append(max(0.0, remainder))
+
+    # Re-normalize to handle quantization errors
+    total = sum(proportions)
+    return [p / total for p in proportions]
+
+
+# Records are processed in blocks of this many seeds to bound memory
+CODEC_BLOCK = 1 << 16
+
+
+def seed_record_size(bits_per_value=8):
+    """Bytes per packed seed: 5 values of bits_per_value bits, byte-aligned."""
+    return (5 * bits_per_value + 7) // 8
+
+
+def encode_seeds_binary(proportions, bits_per_value=8):
+    """
+    Encode many seeds at once into a packed byte buffer.
+
+    Parameters:
+    -----------
+    proportions : array-like, shape (N, 6)
+        One seed per row (normalized per row, as encode_seed_binary)
+    bits_per_value : int
+        Quantization width; values are packed MSB-first back to back,
+        crossing byte boundaries freely
+
+    Returns:
+    --------
+    bytes
+        N records of seed_record_size(bits_per_value) bytes each (5 bytes
+        at 8 bits). Each record starts on a byte boundary, so record i
+        can be read without decoding the ones before it. Quantized values
+        are identical to encode_seed_binary.
+
+    Raises ValueError if a row does not have a positive sum (it has no
+    proportions to encode).
+    """
+    P = np.asarray(proportions, dtype=float).reshape(-1, 6)
+    max_val = (1 << bits_per_value) - 1
+    size = seed_record_size(bits_per_value)
+    shifts = _field_shifts(bits_per_value)
+
+    out = np.empty((len(P), size), dtype=np.uint8)
+    for lo in range(0, len(P), CODEC_BLOCK):
+        block = P[lo:lo + CODEC_BLOCK]
+        total = block.sum(axis=1, keepdims=True)
+        bad = np.flatnonzero(~(total[:, 0] > 0))  # Also catches NaN
+        if len(bad):
+            raise ValueError(f"seed {lo + bad[0]} has no positive proportions to encode")
+        block = block / total  # Normalize
+
+        # Clamp and quantize (truncation, as int() in the scalar codec)
+        q = np.clip(np.trunc(block[:, :5] * max_val), 0, max_val).astype(np.uint64)
+
+        if shifts is not None:
+            # Whole record fits one 64-bit word: OR the fields into place
+            # and keep the leading bytes of its big-endian form
+            word = np.bitwise_or.reduce(q << shifts, axis=1)
+            out[lo:lo + CODEC_BLOCK] = word.astype('>u8').view(np.uint8).reshape(-1, 8)[:, :size]
+        else:
+            bit_shifts = np.arange(bits_per_value - 1, -1, -1, dtype=np.uint64)
+            bits = ((q[:, :, None] >> bit_shifts) & 1).astype(np.uint8)
+            out[lo:lo + CODEC_BLOCK] = np.packbits(bits.reshape(len(q), -1), axis=1)
+
+    return out.tobytes()
+
+
+def _field_shifts(bits_per_value):
+    """Left shifts placing the 5 fields MSB-first in a 64-bit word, or None if they don't fit."""
+    if 5 * bits_per_value > 64:
+        return None
+    return (64 - bits_per_value * np.arange(1, 6)).astype(np.uint64)
+
+
+def decode_seeds_binary(encoded, bits_per_value=8):
+    """
+    Decode a buffer written by encode_seeds_binary.
+
+    encoded may be bytes, a memoryview or a uint8 array (e.g. a
+    memory-mapped file). Returns an (N, 6) float array; row i equals
+    decode_seed_binary applied to seed i.
+    """
+    buf = np.frombuffer(encoded, dtype=np.uint8)
+    size = seed_record_size(bits_per_value)
+    if len(buf) % size:
+        raise ValueError(
+            f"buffer length {len(buf)} is not a multiple of the "
+            f"{size}-byte record size"
+        )
+    records = buf.reshape(-1, size)
+    max_val = (1 << bits_per_value) - 1
+    shifts = _field_shifts(bits_per_value)
+    weights = np.uint64(1) << np.arange(bits_per_value - 1, -1, -1, dtype=np.uint64)
+
+    proportions = np.empty((len(records), 6))
+    word = np.zeros((min(len(records), CODEC_BLOCK), 8), dtype=np.uint8)
+    for lo in range(0, len(records), CODEC_BLOCK):
+        block = records[lo:lo + CODEC_BLOCK]
+        if shifts is not None:
+            w = word[:len(block)]
+            w[:, :size] = block
+            q = (w.view('>u8') >> shifts) & np.uint64(max_val)
+        else:
+            bits = np.unpackbits(block, axis=1)[:, :5 * bits_per_value]
+            q = (bits.reshape(len(block), 5, bits_per_value) * weights).sum(axis=2)
+
+        p = proportions[lo:lo + CODEC_BLOCK]
+        p[:, :5] = q / max_val
+        # 6th value is remainder
+        p[:, 5] = np.maximum(1.0 - p[:, :5].sum(axis=1), 0.0)
+        # Re-normalize to handle quantization errors
+        p /= p.sum(axis=1, keepdims=True)
+
+    return proportions
 
-shells = expand_seed(seed, steps=15)
 
-# Verify
-print()
-passed = verify_expansion(seed, steps=15)
+# =============================================================================
+# VERIFICATION
+# =============================================================================
 
-# Binary encoding
-print("\n" + "-"*60)
-print("BINARY ENCODING")
-print("-"*60)
+def shell_deviation(S, seed):
+    """
+    Deviation of each shell's proportions from the seed's.
 
-encoded = encode_seed_binary(seed)
-print(f"Encoded (5 × 8-bit): {encoded}")
-print(f"Total bits: {len(encoded) * 8}")
+    S : (..., n, 6) shell amplitudes, seed : (..., 6) amplitudes (any
+    scale). Returns (..., n): max_i |S_i / Σ S - seed_i / Σ seed|, the
+    metric verify_expansion reports.
+    """
+    S = np.asarray(S, dtype=float)
+    seed = np.asarray(seed, dtype=float)
+    seed_normalized = seed / seed.sum(axis=-1, keepdims=True)
+    S_prop = S / S.sum(axis=-1, keepdims=True)
+    return np.max(np.abs(S_prop - seed_normalized[..., None, :]), axis=-1)
 
-decoded = decode_seed_binary(encoded)
-print(f"Decoded: {[round(p, 4) for p in decoded]}")
 
-# Verify decoded seed produces same structure
-shells_from_decoded = expand_seed(decoded, steps=5)
-original_final = shells[5]['S'] / shells[5]['S'].sum()
-decoded_final = shells_from_decoded[5]['S'] / shells_from_decoded[5]['S'].sum()
+def verify_expansion(seed, steps=20):
+    """
+    Verify that expansion preserves seed structure.
+    """
+    seed = np.array(seed)
+    seed_normalized = seed / seed.sum()
+
+    shells = expand_seed(seed, steps=steps)
+    deviations = shell_deviation(shells.S, seed)
+
+    print("Verifying structure preservation:")
+    print(f"Seed proportions: {np.round(seed_normalized, 4)}")
+    print()
+
+    for s, deviation in zip(shells, deviations):
+        if s['id'] <= 5 or s['id'] == steps:
+            S_prop = s['S'] / s['S'].sum()
+            print(f"Shell {s['id']:2d}: {np.round(S_prop, 4)} (dev: {deviation:.2e})")
+
+    max_deviation = deviations.max()
+    print(f"\nMax deviation across all shells: {max_deviation:.2e}")
+    print(f"Structure preserved: {'YES' if max_deviation < 1e-10 else 'NO'}")
+
+    return max_deviation < 1e-10
+
+
+def precision_drift(seeds, steps=20, dtype=np.float32, **params):
+    """
+    Measure the drift of a reduced-precision batch expansion.
+
+    Runs expand_seeds_batch at `dtype` and at float64 on the same seeds
+    so a workload can decide whether the halved memory traffic is worth
+    the rounding error.
+
+    Parameters:
+    -----------
+    seeds : array-like, shape (N, 6)
+    steps : int
+    dtype : numpy dtype
+        Reduced working precision to evaluate
+    **params
+        E0, r0, rho, epsilon, sigma_scale (as expand_seed)
+
+    Returns:
+    --------
+    report : dict
+        'dtype'              : name of the evaluated dtype
+        'max_deviation'      : verify_expansion's metric (worst shell,
+                               worst seed) at reduced precision
+        'max_deviation_float64' : the same metric at float64
+        'max_drift'          : largest |S_reduced - S_float64| / E_n, the
+                               amplitude drift relative to each shell's
+                               energy budget
+        'drift_by_shell'     : (steps + 1,) worst relative drift per shell
+        'bytes_ratio'        : shell-array bytes relative to float64
+    """
+    seeds = np.asarray(seeds, dtype=float).reshape(-1, 6)
+    S_ref, _, E_ref = expand_seeds_batch(seeds, steps=steps, **params)
+    S_low, _, _ = expand_seeds_batch(seeds, steps=steps, dtype=dtype, **params)
+
+    drift = np.abs(S_low.astype(float) - S_ref).max(axis=(0, 2)) / E_ref
+    return {
+        'dtype': np.dtype(dtype).name,
+        'max_deviation': float(shell_deviation(S_low, seeds).max()),
+        'max_deviation_float64': float(shell_deviation(S_ref, seeds).max()),
+        'max_drift': float(drift.max()),
+        'drift_by_shell': drift,
+        'bytes_ratio': S_low.itemsize / S_ref.itemsize,
+    }
 
-encoding_error = np.max(np.abs(original_final - decoded_final))
-print(f"Encoding-decoding error at shell 5: {encoding_error:.4f}")
 
-# Summary
-print("\n" + "="*60)
-print("SUMMARY")
-print("="*60)
-print("""
-```
+# =============================================================================
+# DEMO
+# =============================================================================
 
+if __name__ == "__main__":
+    print("="*60)
+    print("PHYSICS-COMPLIANT SEED EXPANSION")
+    print("="*60)
+
+    # Define a seed
+    seed = [0.5, 0.2, 0.15, 0.08, 0.05, 0.02]
+
+    print(f"\nSeed: {seed}")
+    print(f"Interpretation: Strong +X bias, moderate -X and +Y")
+
+    # Expand
+    print("\n" + "-"*60)
+    print("EXPANDING...")
+    print("-"*60)
+
+    # Lazy: only the shells actually read below are grown
+    shells = expand_seed(seed, steps=15, lazy=True)
+
+    # Verify
+    print()
+    passed = verify_expansion(seed, steps=15)
+
+    # Binary encoding
+    print("\n" + "-"*60)
+    print("BINARY ENCODING")
+    print("-"*60)
+
+    encoded = encode_seed_binary(seed)
+    print(f"Encoded (5 × 8-bit): {encoded}")
+    print(f"Total bits: {len(encoded) * 8}")
+
+    decoded = decode_seed_binary(encoded)
+    print(f"Decoded: {[round(p, 4) for p in decoded]}")
+
+    # Verify decoded seed produces same structure
+    shells_from_decoded = expand_seed(decoded, steps=5)
+    original_final = shells[5]['S'] / shells[5]['S'].sum()
+    decoded_final = shells_from_decoded[5]['S'] / shells_from_decoded[5]['S'].sum()
+
+    encoding_error = np.max(np.abs(original_final - decoded_final))
+    print(f"Encoding-decoding error at shell 5: {encoding_error:.4f}")
+    print(f"Shells grown to read shell 5: {shells.materialized} of {len(shells)}")
+
+    # Bulk codec
+    bulk = np.random.default_rng(0).dirichlet(np.ones(6), size=1000)
+    packed = encode_seeds_binary(bulk)
+    unpacked = decode_seeds_binary(packed)
+    scalar_match = all(
+        np.array_equal(unpacked[i], decode_seed_binary(encode_seed_binary(b)))
+        for i, b in enumerate(bulk)
+    )
+    print(f"Bulk codec: {len(bulk)} seeds -> {len(packed)} bytes, "
+          f"matches per-seed codec: {scalar_match}")
+    try:
+        encode_seeds_binary(np.vstack([bulk[:3], np.zeros(6)]))
+        zero_rejected = False
+    except ValueError:
+        zero_rejected = True
+    print(f"All-zero seed rejected: {zero_rejected}")
+    print(f"Status: {'PASS' if scalar_match and zero_rejected else 'FAIL'}")
+
+    # Batch expansion
+    print("\n" + "-"*60)
+    print("BATCH EXPANSION")
+    print("-"*60)
+
+    batch = np.array([seed, decoded, [1, 1, 1, 1, 1, 1]], dtype=float)
+    S_batch, r_batch, E_batch = expand_seeds_batch(batch, steps=15)
+    print(f"Amplitude tensor shape: {S_batch.shape}")
+
+    batch_error = max(
+        np.max(np.abs(S_batch[i] - expand_seed(b, steps=15).S))
+        for i, b in enumerate(batch)
+    )
+    print(f"Max difference vs per-seed expansion: {batch_error:.2e}")
+
+    # Reduced precision
+    print("\n" + "-"*60)
+    print("FLOAT32 DRIFT")
+    print("-"*60)
+
+    report = precision_drift(bulk, steps=15)
+    print(f"Max deviation: {report['max_deviation']:.2e} "
+          f"(float64: {report['max_deviation_float64']:.2e})")
+    print(f"Max drift vs float64 (relative to shell energy): {report['max_drift']:.2e}")
+    print(f"Memory per shell array: {report['bytes_ratio']:.0%} of float64")
+
+    # Summary
+    print("\n" + "="*60)
+    print("SUMMARY")
+    print("="*60)
+    print("""
 This algorithm achieves:
 
 1. MINIMAL SEED: 40 bits encodes the complete structure
-1. PHYSICS-COMPLIANT EXPANSION: Any decompressor following
+2. PHYSICS-COMPLIANT EXPANSION: Any decompressor following
    energy conservation + field-mediated coupling arrives
    at identical structure
-1. PAUSE-ANYWHERE: Every shell is a valid stable state;
+3. PAUSE-ANYWHERE: Every shell is a valid stable state;
    resources can be exhausted at any point
-1. RESUME-WITHOUT-LOSS: Inner shells fully determine outer
+4. RESUME-WITHOUT-LOSS: Inner shells fully determine outer
    shells; causality flows one direction only
-1. SCALE-INVARIANT: Structure preserved regardless of how
+5. SCALE-INVARIANT: Structure preserved regardless of how
    many shells are expanded
 
-The seed doesn’t describe the structure - it IS the structure
+The seed doesn't describe the structure - it IS the structure
 at its most compressed form. The expansion rules are physics
 itself, shared by any valid decompressor.
-“””)
+""")
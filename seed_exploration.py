@@ -0,0 +1,870 @@
+"""
+Seed Exploration: Adaptive Growth Module
+=========================================
+
+Extension to seed_expansion.py that adds adaptive, non-linear growth
+capabilities when energy is abundant.
+
+CORE PRINCIPLE:
+- expand() preserves structure exactly (the trunk)
+- explore() allows adaptive variation (the branches)
+- Switch between modes based on energy budget vs complexity cost
+
+When energy is abundant:
+- Adaptive sharpness: field focus responds to local density
+- Saturation: prevents single-direction dominance
+- Resonance: past shells weakly influence current formation
+
+When energy is scarce:
+- Falls back to deterministic expand() mode
+- Structure crystallizes and preserves
+
+The complexity cost (Shannon entropy) of the seed determines the
+energy threshold for switching between modes.
+
+Author:  (Kavik Ulu) and AI partners - MIT License
+"""
+
+import numpy as np
+
+import instrumentation
+
+# Import core functions from seed_expansion
+from seed_expansion import (
+    normalize_to_energy,
+    influence_operator,
+    apply_influence,
+    horizon_start,
+    influence_norm,
+)
+from shell_stack import ShellStack, as_arrays, MODES, MODE_SEED, MODE_EXPLORE, MODE_EXPAND
+
+
+# =============================================================================
+# COMPLEXITY COST (Information-Theoretic)
+# =============================================================================
+
+def shannon_entropy(S, eps=1e-12):
+    """
+    Calculate Shannon entropy H(S) of amplitude distribution.
+
+    H(S) = -Σ p_i × log₂(p_i)
+
+    Returns entropy in bits. S may be a stack of shape (..., 6) (a whole
+    expansion, or a batch); the result then has shape (...).
+    """
+    S_prop = S / (S.sum(axis=-1, keepdims=True) + eps)
+    S_prop = np.maximum(S_prop, eps)  # Avoid log(0)
+    return -np.sum(S_prop * np.log2(S_prop), axis=-1)
+
+
+def complexity_cost(S, H_max=2.585):
+    """
+    Calculate complexity cost C(S) = H_max - H(S).
+
+    - Uniform distribution: C ≈ 0 (low cost, easy to maintain)
+    - Highly asymmetric: C → H_max (high cost, expensive to maintain)
+
+    H_max ≈ 2.585 bits for 6 states (log₂(6)).
+
+    Accepts (..., 6) stacks like shannon_entropy.
+    """
+    H_S = shannon_entropy(S)
+    return H_max - H_S
+
+
+def branching_threshold(S, k=0.5):
+    """
+    Calculate energy threshold for branching.
+
+    E_branch = k × C(S)
+
+    When E > E_branch: explore() mode (innovation)
+    When E < E_branch: expand() mode (preservation)
+    """
+    return k * complexity_cost(S)
+
+
+# =============================================================================
+# DYNAMIC PARAMETERS
+# =============================================================================
+
+def dynamic_sigma(field, sigma_min=0.1, sigma_max=0.8, gamma=2.0, phi_max=1.0):
+    """
+    Adaptive sharpness: sigma shrinks as field strength increases.
+
+    σ_n = σ_min + (σ_max - σ_min) × exp(-γ × ||Φ||/Φ_max)
+
+    High field density → sharp influence → branching
+    Low field density → diffuse influence → smoothing
+
+    field may be a stack of shape (..., 6); one sigma per row.
+    """
+    field_magnitude = np.linalg.norm(field, axis=-1)
+    normalized = field_magnitude / phi_max
+    sigma = sigma_min + (sigma_max - sigma_min) * np.exp(-gamma * normalized)
+    return np.clip(sigma, sigma_min, sigma_max)
+
+
+def dynamic_epsilon(S_prev, epsilon_max=0.95, epsilon_min=0.50, H_max=2.585):
+    """
+    Dynamic energy decay based on previous shell's complexity.
+
+    ε_n = ε_max - (ε_max - ε_min) × C(S_{n-1})/H_max
+
+    Asymmetric shells → low ε → rapid energy decay
+    Symmetric shells → high ε → slow energy decay
+
+    This creates self-regulating feedback:
+    Asymmetry → High cost → Rapid stabilization
+    """
+    C_S = complexity_cost(S_prev, H_max)
+    decay_range = epsilon_max - epsilon_min
+    normalized_cost = C_S / H_max
+    return epsilon_max - (decay_range * normalized_cost)
+
+
+# =============================================================================
+# EXPLORATION MECHANISMS
+# =============================================================================
+
+def resonance_field(shells, alpha=0.05, beta=0.25):
+    """
+    Calculate resonance contribution from all inner shells.
+
+    Resonance_n = Σ α × V_i × exp(-β × (n-i))
+
+    Where V_i = S_i/||S_i|| - 1/6 (deviation from uniform)
+
+    Past shell structure weakly influences current formation,
+    creating long-range correlations.
+    """
+    _, S = as_arrays(shells)
+    return resonance_arrays(S, alpha, beta)
+
+
+def resonance_arrays(S, alpha=0.05, beta=0.25):
+    """
+    Resonance from contiguous (n, 6) amplitudes, innermost first.
+    """
+    n = len(S)
+    S_prop = S / S.sum(axis=1, keepdims=True)
+    V = S_prop - (1/6)  # Deviation from uniform
+
+    decay = np.exp(-beta * (n - np.arange(n)))
+    return alpha * (decay @ V)
+
+
+def resonance_step(R, P, beta=0.25):
+    """
+    Advance the running resonance state by one shell.
+
+    R_n = Σ V_i × exp(-β × (n-i)) over the n shells formed so far
+    satisfies
+
+        R_{n+1} = exp(-β) × (R_n + V_n)
+
+    so resonance_field = α × R_n costs O(1) per shell instead of a
+    rescan of every inner shell. Start from R_0 = 0.
+
+    P is the new shell's proportions S / ΣS.
+    """
+    V = P - (1/6)  # Deviation from uniform
+    return np.exp(-beta) * (R + V)
+
+
+def saturate(field, kappa=5.0):
+    """
+    Apply saturation to prevent single-direction dominance.
+
+    S_saturated = tanh(κ × Φ)
+
+    For small values: tanh(x) ≈ x (linear response)
+    For large values: tanh(x) → 1 (saturation)
+
+    This forces more equitable energy distribution.
+    """
+    return np.tanh(kappa * field)
+
+
+def efficiency_stress(S, H_max=2.585):
+    """
+    Calculate efficiency stress for each direction.
+
+    Stress_i = C(p_i) × |p_i - 1/6|
+
+    High stress = direction is costly to maintain.
+    Used for pruning inefficient branches.
+
+    S may be a stack of shape (..., 6); stress is returned per row.
+    """
+    S_prop = S / S.sum(axis=-1, keepdims=True)
+
+    # Deviation from ideal uniform state
+    deviation = np.abs(S_prop - (1/6))
+
+    # Weight by how "extreme" this amplitude is:
+    # -p*log(p) as complexity contribution, 0 at p = 0 and p = 1
+    extreme = (S_prop > 1e-12) & (S_prop < 1)
+    C = np.where(extreme, -S_prop * np.log2(np.where(extreme, S_prop, 1.0)), 0.0)
+
+    return C * deviation
+
+
+def prune_and_reinvest(field_saturated, S_prev, E_new, lambda_prune=0.2):
+    """
+    Apply pruning based on efficiency stress, then reinvest energy.
+
+    S_new = Φ_saturated - λ × Σ_stress
+
+    Energy from pruned directions redistributes to efficient ones.
+
+    Works row-wise on (..., 6) stacks; E_new is then a scalar or an
+    array broadcastable to (..., 1).
+    """
+    stress = efficiency_stress(S_prev)
+
+    # Subtractive causality
+    S_pruned = field_saturated - (lambda_prune * stress)
+
+    # Clamp negative values and normalize
+    S_pruned = np.maximum(S_pruned, 0.0)
+
+    return normalize_to_energy(S_pruned, E_new)
+
+
+# =============================================================================
+# FIELD CALCULATION FOR EXPLORATION
+# =============================================================================
+
+def total_field_explore(shells, r_sample, W, sigma_min=0.1, sigma_max=0.8,
+                        gamma=2.0, alpha=0.05, beta=0.25, start=0):
+    """
+    Calculate total field with dynamic sigma and resonance.
+
+    1. Compute base field with average sigma
+    2. Determine dynamic sigma from field magnitude
+    3. Recompute field with dynamic sigma
+    4. Add resonance term
+
+    start skips shells [0, start) in both envelope passes (they lie
+    beyond the horizon, see horizon_start); resonance still sees every
+    shell.
+    """
+    r, S = as_arrays(shells)
+    return total_field_explore_arrays(r[start:], S[start:], r_sample, W,
+                                      sigma_min, sigma_max, gamma,
+                                      resonance_arrays(S, alpha, beta))
+
+
+def total_field_explore_arrays(r, S, r_sample, W, sigma_min=0.1, sigma_max=0.8,
+                               gamma=2.0, resonance=0.0, recorder=None):
+    """
+    total_field_explore over contiguous r (n,) and S (n, 6) arrays.
+
+    Only the shells passed take part in the envelope passes; the
+    resonance term is supplied precomputed (α × R_n, see resonance_step).
+
+    Both passes share one gather of the inner shells and the envelope
+    exponent d_i = (r_sample - r_i)² / (2 r_i²), so that
+    f(r_i) = exp(-d_i / σ²) for either sigma: the second pass costs one
+    exp and one matvec.
+
+    recorder (see instrumentation) times the field, dynamic_sigma and
+    resonance phases.
+    """
+    inner = r < r_sample  # Causality: only inner shells contribute
+    if not inner.all():
+        r, S = r[inner], S[inner]
+    d = (r_sample - r)**2 / (2 * r**2)
+
+    # First pass: get field magnitude with default sigma
+    default_sigma = (sigma_min + sigma_max) / 2
+    base_field = apply_influence(W, np.exp(-d / default_sigma**2) @ S)
+
+    if recorder is not None:
+        recorder.tick('field')
+
+    # Determine dynamic sigma
+    sigma_n = dynamic_sigma(base_field, sigma_min, sigma_max, gamma)
+    if recorder is not None:
+        recorder.tick('dynamic_sigma')
+
+    # Second pass: recompute with dynamic sigma
+    field = apply_influence(W, np.exp(-d / sigma_n**2) @ S)
+    if recorder is not None:
+        recorder.count('field_evals')
+        recorder.count('envelope_exp', 2 * len(d))
+        recorder.count('contractions', 2)
+        recorder.count('influence_apply', 2)
+        recorder.tick('field')
+
+    # Add resonance
+    field += resonance
+    if recorder is not None:
+        recorder.tick('resonance')
+
+    return field
+
+
+# =============================================================================
+# MAIN EXPLORATION ALGORITHM
+# =============================================================================
+
+def explore_seed(seed, E0=1.0, r0=1.0, steps=10, rho=1.3,
+                 kappa=5.0, alpha=0.05, beta=0.25,
+                 sigma_min=0.1, sigma_max=0.8, gamma=2.0,
+                 lambda_prune=0.2, k_threshold=0.5,
+                 epsilon_max=0.95, epsilon_min=0.50, tol=0.0):
+    """
+    Explore seed with adaptive, non-linear growth.
+
+    Parameters:
+    -----------
+    seed : array-like, length 6
+        Initial proportional amplitudes
+    E0 : float
+        Initial energy budget
+    r0 : float
+        Initial radius
+    steps : int
+        Number of shells to grow
+    rho : float
+        Radial scaling factor
+    kappa : float
+        Saturation gain (higher = more dampening)
+    alpha : float
+        Resonance strength
+    beta : float
+        Resonance decay rate
+    sigma_min, sigma_max : float
+        Bounds for adaptive sharpness
+    gamma : float
+        Sharpness sensitivity to field strength
+    lambda_prune : float
+        Pruning sensitivity
+    k_threshold : float
+        Branching threshold scaling
+    epsilon_max, epsilon_min : float
+        Bounds for dynamic energy decay
+    tol : float
+        Opt-in horizon: inner shells whose envelope (at sigma_max) is
+        below tol are skipped when sampling the field. 0 (default) only
+        skips shells whose contribution underflows to exactly 0.
+
+    Returns:
+    --------
+    shells : ShellStack
+        Contiguous shell arrays with mode tracking; indexing/iteration
+        yields dicts with 'id', 'r', 'E', 'S', 'mode', 'epsilon'.
+        shells.error_bound bounds the amplitude error the horizon can
+        induce on each EXPLORE shell, given the shells already formed
+        (the mode switch is discontinuous, so errors are not carried
+        across shells).
+    """
+    shells = ShellStack(capacity=steps + 1, modes=True)
+    err_max = 0.0
+    for r, E, S, mode, epsilon_n, err in _exploration_steps(
+            seed, E0, r0, steps, rho, kappa, alpha, beta, sigma_min, sigma_max,
+            gamma, lambda_prune, k_threshold, epsilon_max, epsilon_min, tol):
+        shells.append(r, E, S, mode=mode, epsilon=epsilon_n, error=err / 2)
+        err_max = max(err_max, err)
+
+    shells.error_bound = err_max / 2
+    return shells
+
+
+def iter_explore(seed, E0=1.0, r0=1.0, steps=10, rho=1.3,
+                 kappa=5.0, alpha=0.05, beta=0.25,
+                 sigma_min=0.1, sigma_max=0.8, gamma=2.0,
+                 lambda_prune=0.2, k_threshold=0.5,
+                 epsilon_max=0.95, epsilon_min=0.50, tol=0.0):
+    """
+    Generator counterpart of explore_seed.
+
+    Yields shells one at a time as dicts with 'id', 'r', 'E', 'S',
+    'mode', 'epsilon' and 'error'. Only shells still inside the field
+    horizon are kept (resonance is a running state), so memory stays
+    flat.
+
+    steps=None keeps growing until the consumer stops.
+    """
+    steps_iter = _exploration_steps(
+        seed, E0, r0, steps, rho, kappa, alpha, beta, sigma_min, sigma_max,
+        gamma, lambda_prune, k_threshold, epsilon_max, epsilon_min, tol)
+    return _explore_dicts(steps_iter)
+
+
+def _explore_dicts(steps_iter):
+    for n, (r, E, S, mode, epsilon_n, err) in enumerate(steps_iter):
+        yield {
+            'id': n,
+            'r': float(r),
+            'E': float(E),
+            'S': S.copy(),
+            'mode': MODES[mode],
+            'epsilon': epsilon_n,
+            'error': err / 2
+        }
+
+
+@instrumentation.with_recorder
+def _exploration_steps(seed, E0, r0, steps, rho, kappa, alpha, beta,
+                       sigma_min, sigma_max, gamma, lambda_prune, k_threshold,
+                       epsilon_max, epsilon_min, tol, recorder=None):
+    """
+    Core exploration loop shared by explore_seed and iter_explore.
+
+    Yields (r, E, S, mode, epsilon, err) per shell, seed included; S is
+    a view into a reused buffer.
+    """
+    W = influence_operator()
+
+    # Initialize
+    seed_arr = np.array(seed, dtype=float)
+    seed_normalized = normalize_to_energy(seed_arr, E0)
+    seed_proportions = seed_normalized / E0  # For expand() fallback
+
+    # Calculate global branching threshold
+    E_branch = branching_threshold(seed_arr, k_threshold)
+
+    # Radii increase when rho > 1, so shells beyond the field horizon
+    # form a prefix; sigma_max gives the widest envelope
+    windowed = rho > 1
+    if tol > 0:
+        w_norm = influence_norm(W)
+        E_dropped = 0.0
+        # dynamic_sigma is Lipschitz in ||Φ|| with this constant
+        sigma_gain = (sigma_max - sigma_min) * gamma
+
+    size = 16
+    r_buf = np.empty(size)
+    E_buf = np.empty(size)
+    S_buf = np.empty((size, 6))
+    r_buf[0] = r0
+    E_buf[0] = E0
+    S_buf[0] = seed_normalized
+    count = 1
+    lo = 0  # First shell inside the field horizon
+    R = resonance_step(np.zeros(6), seed_normalized / seed_normalized.sum(), beta)
+    yield r0, E0, S_buf[0], MODE_SEED, None, 0.0
+
+    rec = recorder
+    n = 0
+    while steps is None or n < steps:
+        if rec is not None:
+            rec.lap('explore')
+        r_new = rho * r_buf[count - 1]
+        S_prev = S_buf[count - 1]
+
+        if windowed:
+            start = lo + horizon_start(r_buf[lo:count], r_new, sigma_max, tol)
+            if tol > 0:
+                E_dropped += E_buf[lo:start].sum()
+            lo = start
+        else:
+            lo = count - 1
+
+        # Dynamic energy decay based on previous shell's complexity
+        epsilon_n = dynamic_epsilon(S_prev, epsilon_max, epsilon_min)
+        E_new = epsilon_n * E_buf[count - 1]
+        if rec is not None:
+            rec.tick('horizon')
+
+        err = 0.0
+        # Mode decision
+        if E_new > E_branch:
+            # EXPLORE MODE: Adaptive, non-linear growth
+
+            # Calculate field with dynamic sigma and resonance
+            field = total_field_explore_arrays(
+                r_buf[lo:count], S_buf[lo:count], r_new, W,
+                sigma_min, sigma_max, gamma, alpha * R, rec
+            )
+
+            # Apply saturation
+            field_saturated = saturate(field, kappa)
+            if rec is not None:
+                rec.tick('saturation')
+
+            # Prune inefficient directions and reinvest energy
+            S_new = prune_and_reinvest(field_saturated, S_prev, E_new, lambda_prune)
+            if rec is not None:
+                rec.tick('prune_and_reinvest')
+
+            if tol > 0 and windowed:
+                # Skipped shells move either envelope pass by at most
+                # ||W|| × tol × E_dropped; the base-pass error also shifts
+                # sigma_n, and |∂f/∂σ| ≤ 3√3·e^(-3/2) / gap for each kept
+                # shell. tanh(κΦ) is κ-Lipschitz and pruning/clamping does
+                # not expand errors; normalizing costs 2 × E / ||pruned||.
+                drop = w_norm * tol * E_dropped
+                gap = r_new / r_buf[lo:count] - 1
+                slope = w_norm * 3 * np.sqrt(3) * np.exp(-1.5) * (E_buf[lo:count] / gap).sum()
+                delta = kappa * (drop + slope * sigma_gain * drop)
+                pruned = np.maximum(
+                    field_saturated - lambda_prune * efficiency_stress(S_prev), 0.0
+                ).sum()
+                err = 2 * E_new * min(delta / pruned, 1.0) if pruned > 0 else 2 * E_new
+                if rec is not None:
+                    rec.tick('error_bound')
+
+            mode = MODE_EXPLORE
+        else:
+            # EXPAND MODE: Deterministic preservation
+            # Preserve seed proportions exactly
+            S_new = normalize_to_energy(seed_proportions.copy(), E_new)
+            mode = MODE_EXPAND
+            if rec is not None:
+                rec.tick('expand')
+
+        R = resonance_step(R, S_new / S_new.sum(), beta)
+        if rec is not None:
+            rec.tick('resonance')
+
+        if count == size:
+            if lo >= size // 2:
+                # Release shells behind the horizon
+                for buf in (r_buf, E_buf, S_buf):
+                    buf[:count - lo] = buf[lo:count]
+                count -= lo
+                lo = 0
+            else:
+                size *= 2
+                r_buf, E_buf, S_buf = (
+                    np.concatenate([buf, np.empty_like(buf)])
+                    for buf in (r_buf, E_buf, S_buf)
+                )
+
+        r_buf[count] = r_new
+        E_buf[count] = E_new
+        S_buf[count] = S_new
+        count += 1
+        n += 1
+        if rec is not None:
+            rec.shell(n, r_new, E_new, S_buf[count - 1], err,
+                      mode=MODES[mode], epsilon=epsilon_n)
+        yield r_new, E_new, S_buf[count - 1], mode, epsilon_n, err
+
+
+# =============================================================================
+# BATCHED EXPLORATION
+# =============================================================================
+
+def explore_seeds_batch(seeds, E0=1.0, r0=1.0, steps=10, rho=1.3,
+                        kappa=5.0, alpha=0.05, beta=0.25,
+                        sigma_min=0.1, sigma_max=0.8, gamma=2.0,
+                        lambda_prune=0.2, k_threshold=0.5,
+                        epsilon_max=0.95, epsilon_min=0.50):
+    """
+    Explore many seeds in lockstep.
+
+    Radii are shared by all seeds, so the field horizon and envelope
+    exponents are computed once per shell. Each step splits the batch
+    with a mask: seeds whose budget is above their branching threshold
+    run the EXPLORE path (dynamic-sigma field, resonance, saturation,
+    pruning) as array operations, the rest rescale their seed
+    proportions (EXPAND).
+
+    Parameters:
+    -----------
+    seeds : array-like, shape (N, 6)
+        Initial proportional amplitudes, one seed per row
+    E0, r0, steps, rho, kappa, alpha, beta, sigma_min, sigma_max,
+    gamma, lambda_prune, k_threshold, epsilon_max, epsilon_min :
+        As for explore_seed
+
+    Returns:
+    --------
+    S : ndarray, shape (N, steps + 1, 6)
+        Shell amplitudes; S[i] matches explore_seed(seeds[i]).S to
+        rounding
+    r : ndarray, shape (steps + 1,)
+        Shell radii (shared by all seeds)
+    E : ndarray, shape (N, steps + 1)
+        Per-seed energy budgets
+    mode : ndarray, shape (N, steps + 1), int8
+        Mode codes (indices into MODES)
+    """
+    W = influence_operator()
+    seeds = np.asarray(seeds, dtype=float).reshape(-1, 6)
+    N = len(seeds)
+
+    # Shell-major while growing so the inner shells are contiguous
+    r = np.empty(steps + 1)
+    E = np.empty((steps + 1, N))
+    S = np.empty((steps + 1, N, 6))
+    mode = np.empty((steps + 1, N), dtype=np.int8)
+
+    seed_normalized = normalize_to_energy(seeds, E0)
+    seed_proportions = seed_normalized / E0  # For expand() fallback
+    E_branch = branching_threshold(seeds, k_threshold)
+
+    r[0] = r0
+    E[0] = E0
+    S[0] = seed_normalized
+    mode[0] = MODE_SEED
+    P = seed_normalized / seed_normalized.sum(axis=1, keepdims=True)
+    R = np.exp(-beta) * (P - (1/6))  # Running resonance (see resonance_step)
+
+    windowed = rho > 1
+    default_sigma = (sigma_min + sigma_max) / 2
+    lo = 0
+    for n in range(1, steps + 1):
+        r[n] = rho * r[n - 1]
+        S_prev = S[n - 1]
+
+        if windowed:
+            lo += horizon_start(r[lo:n], r[n], sigma_max)
+        else:
+            lo = n - 1
+
+        # Dynamic energy decay based on previous shell's complexity
+        E[n] = dynamic_epsilon(S_prev, epsilon_max, epsilon_min) * E[n - 1]
+
+        explore = E[n] > E_branch
+        expand = ~explore
+
+        # EXPAND MODE: Preserve seed proportions exactly
+        S[n, expand] = normalize_to_energy(seed_proportions[expand], E[n, expand, None])
+        mode[n, expand] = MODE_EXPAND
+
+        # EXPLORE MODE: Adaptive, non-linear growth
+        idx = np.flatnonzero(explore)
+        if len(idx):
+            r_in = r[lo:n]
+            inner = r_in < r[n]  # Causality: only inner shells contribute
+            r_in = r_in[inner]
+            window = S[lo:n][inner][:, idx]  # (m, k, 6)
+            d = (r[n] - r_in)**2 / (2 * r_in**2)
+
+            # Base pass with default sigma, then per-seed dynamic sigma
+            base_field = apply_influence(
+                W, np.tensordot(np.exp(-d / default_sigma**2), window, axes=1)
+            )
+            sigma_n = dynamic_sigma(base_field, sigma_min, sigma_max, gamma)
+            f_n = np.exp(-d / sigma_n[:, None]**2)  # (k, m)
+            field = apply_influence(W, np.einsum('km,mkj->kj', f_n, window))
+            field += alpha * R[idx]
+
+            # Saturate, prune inefficient directions and reinvest energy
+            field_saturated = saturate(field, kappa)
+            S[n, idx] = prune_and_reinvest(
+                field_saturated, S_prev[idx], E[n, idx, None], lambda_prune
+            )
+            mode[n, idx] = MODE_EXPLORE
+
+        P = S[n] / S[n].sum(axis=1, keepdims=True)
+        R = np.exp(-beta) * (R + (P - (1/6)))
+
+    return (
+        np.ascontiguousarray(S.transpose(1, 0, 2)),
+        r,
+        np.ascontiguousarray(E.T),
+        np.ascontiguousarray(mode.T),
+    )
+
+
+def full_growth(seed, E0=1.0, r0=1.0, steps=10, **kwargs):
+    """
+    Convenience wrapper for explore_seed with sensible defaults.
+
+    Returns shells with mode information showing where
+    exploration vs expansion occurred.
+    """
+    return explore_seed(seed, E0, r0, steps, **kwargs)
+
+
+# =============================================================================
+# ANALYSIS UTILITIES
+# =============================================================================
+
+def analyze_growth(shells, seed):
+    """
+    Analyze growth pattern and return summary statistics.
+
+    shells may be a ShellStack or a list of shell dicts. Traces are
+    arrays with one entry per shell, computed in one pass over the
+    whole stack.
+    """
+    if not isinstance(shells, ShellStack):
+        shells = ShellStack.from_dicts(shells)
+    seed_prop = np.array(seed) / np.sum(seed)
+
+    S = shells.S
+    mode = shells.mode
+    S_prop = S / S.sum(axis=1, keepdims=True)
+    deviation = np.max(np.abs(S_prop - seed_prop), axis=1)
+
+    # Find switch point
+    switches = np.flatnonzero((mode[1:] == MODE_EXPAND) & (mode[:-1] == MODE_EXPLORE))
+
+    return {
+        'total_shells': len(shells),
+        'explore_shells': int(np.count_nonzero(mode == MODE_EXPLORE)),
+        'expand_shells': int(np.count_nonzero(mode == MODE_EXPAND)),
+        'switch_point': int(switches[0]) + 1 if len(switches) else None,
+        'final_deviation': deviation[-1],
+        'max_deviation': max(deviation.max(), 0.0),
+        'energy_trace': shells.E.copy(),
+        'complexity_trace': complexity_cost(S),
+        'deviation_trace': deviation
+    }
+
+
+def print_growth_summary(shells, seed):
+    """
+    Print formatted summary of growth.
+    """
+    analysis = analyze_growth(shells, seed)
+    seed_prop = np.array(seed) / np.sum(seed)
+
+    print("="*70)
+    print("GROWTH SUMMARY")
+    print("="*70)
+    print(f"Seed proportions: {np.round(seed_prop, 4)}")
+    print(f"Seed complexity cost: {complexity_cost(np.array(seed)):.4f}")
+    print(f"Branching threshold: {branching_threshold(np.array(seed)):.4f}")
+    print()
+    print(f"Total shells: {analysis['total_shells']}")
+    print(f"Explore shells: {analysis['explore_shells']}")
+    print(f"Expand shells: {analysis['expand_shells']}")
+    print(f"Switch point: Shell {analysis['switch_point']}")
+    print()
+    print(f"Max deviation from seed: {analysis['max_deviation']:.4f}")
+    print(f"Final deviation: {analysis['final_deviation']:.4f}")
+    print()
+
+    print("Shell-by-shell:")
+    print("-"*70)
+    print(f"{'Shell':>5} {'Mode':>8} {'Epsilon':>8} {'Energy':>10} {'C(S)':>8} {'Deviation':>10}")
+    print("-"*70)
+
+    for s, C_S, deviation in zip(shells, analysis['complexity_trace'],
+                                 analysis['deviation_trace']):
+        eps_str = f"{s['epsilon']:.4f}" if s['epsilon'] else "N/A"
+
+        print(f"{s['id']:>5} {s['mode']:>8} {eps_str:>8} {s['E']:>10.6f} {C_S:>8.4f} {deviation:>10.4f}")
+
+
+# =============================================================================
+# VERIFICATION
+# =============================================================================
+
+def verify_exploration(seed, steps=15):
+    """
+    Verify exploration produces expected behavior.
+    """
+    print("="*70)
+    print("EXPLORATION VERIFICATION")
+    print("="*70)
+
+    shells = explore_seed(seed, steps=steps)
+    print_growth_summary(shells, seed)
+
+    # Check key properties
+    print()
+    print("Verification checks:")
+
+    # 1. Energy conservation (each shell sums to its E)
+    energy_check = all(
+        abs(s['S'].sum() - s['E']) < 1e-10
+        for s in shells
+    )
+    print(f"  Energy conservation: {'PASS' if energy_check else 'FAIL'}")
+
+    # 2. Mode switching occurred
+    modes = [s['mode'] for s in shells]
+    has_explore = 'EXPLORE' in modes
+    has_expand = 'EXPAND' in modes
+    print(f"  Explore mode used: {'YES' if has_explore else 'NO'}")
+    print(f"  Expand mode used: {'YES' if has_expand else 'NO'}")
+
+    # 3. Deviation from seed (should be non-zero for explore shells)
+    seed_prop = np.array(seed) / np.sum(seed)
+    explore_deviations = []
+    for s in shells:
+        if s['mode'] == 'EXPLORE':
+            S_prop = s['S'] / s['S'].sum()
+            explore_deviations.append(np.max(np.abs(S_prop - seed_prop)))
+
+    if explore_deviations:
+        max_explore_dev = max(explore_deviations)
+        print(f"  Max explore deviation: {max_explore_dev:.4f}")
+        print(f"  Branching occurred: {'YES' if max_explore_dev > 0.01 else 'MINIMAL'}")
+
+    return shells
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    print("="*70)
+    print("SEED EXPLORATION MODULE")
+    print("Adaptive Growth with Complexity-Based Mode Switching")
+    print("="*70)
+
+    # Test 1: Asymmetric seed (high complexity cost, early stabilization)
+    print("\n" + "="*70)
+    print("TEST 1: Asymmetric Seed (High Complexity Cost)")
+    print("="*70)
+    asymmetric_seed = [0.5, 0.2, 0.15, 0.08, 0.05, 0.02]
+    shells_asym = verify_exploration(asymmetric_seed, steps=12)
+
+    # Test 2: Near-symmetric seed (low complexity cost, extended exploration)
+    print("\n" + "="*70)
+    print("TEST 2: Near-Symmetric Seed (Low Complexity Cost)")
+    print("="*70)
+    symmetric_seed = [0.18, 0.17, 0.17, 0.16, 0.16, 0.16]
+    shells_sym = verify_exploration(symmetric_seed, steps=12)
+
+    # Test 3: Highly asymmetric seed (very high cost, immediate stabilization)
+    print("\n" + "="*70)
+    print("TEST 3: Highly Asymmetric Seed (Very High Complexity Cost)")
+    print("="*70)
+    extreme_seed = [0.80, 0.10, 0.05, 0.03, 0.01, 0.01]
+    shells_extreme = verify_exploration(extreme_seed, steps=12)
+
+    # Test 4: All three seeds at once through the batched engine
+    print("\n" + "="*70)
+    print("TEST 4: Batched Exploration")
+    print("="*70)
+    batch = [asymmetric_seed, symmetric_seed, extreme_seed]
+    S_batch, r_batch, E_batch, mode_batch = explore_seeds_batch(batch, steps=12)
+    singles = [explore_seed(seed, steps=12) for seed in batch]
+    modes_match = all(np.array_equal(m, s.mode) for m, s in zip(mode_batch, singles))
+    batch_error = max(np.max(np.abs(S - s.S)) for S, s in zip(S_batch, singles))
+    print(f"\nModes match per-seed exploration: {modes_match}")
+    print(f"Max amplitude difference: {batch_error:.2e}")
+
+    print("\n" + "="*70)
+    print("INTERPRETATION")
+    print("="*70)
+    print("""
+The exploration module demonstrates:
+
+1. COMPLEXITY-BASED SWITCHING
+   - High-cost seeds (asymmetric) stabilize early
+   - Low-cost seeds (symmetric) explore longer
+   - "Symmetry tends to happen" emerges from energy constraints
+
+2. ADAPTIVE MECHANISMS
+   - Dynamic sharpness: field focus responds to density
+   - Saturation: prevents single-direction dominance
+   - Resonance: past shells influence current formation
+   - Pruning: inefficient directions shed energy to efficient ones
+
+3. SELF-REGULATION
+   - Asymmetry is metabolically expensive
+   - High cost → rapid energy decay → early stabilization
+   - The system naturally tends toward lower-energy configurations
+
+4. TWO-PHASE LIFECYCLE
+   - EXPLORE: High energy, innovation, branching
+   - EXPAND: Low energy, preservation, crystallization
+
+The final structure is a record of both the seed's information content
+and the history of its available energy.
+""")
@@ -0,0 +1,245 @@
+"""
+Seed Inverse: Recovering Seeds from Observed Shells
+
+compress_to_seed reads shell 0. When only outer shells are observed,
+or the observations are noisy or incomplete, the seed has to be fitted.
+
+The growth model makes the fit closed-form. The field at a new shell,
+
+    Φ_n = W @ Σ_i f(r_i, r_n) × S_i
+
+is linear in the inner shells, W is the identity for the octahedron
+(influence_operator), and every shell sums to its budget E_i. Write
+each shell as E_i × (α_i p + (1 - α_i) u), a blend of the seed
+proportions p and the uniform pattern u that normalize_to_energy falls
+back to when the field vanishes. Then Φ_n is again such a blend, with
+
+    α_n = Σ_i f_i E_i α_i / Σ_i f_i E_i
+
+and its total Σ_i f_i E_i does not depend on p either. So for any
+envelope, horizon and fallback, every shell of expand_seed and grow is
+affine in the seed:
+
+    S_n = a_n p + b_n,   a_n = E_n α_n,   b_n = E_n (1 - α_n) / 6
+
+shell_response obtains (a_n, b_n) from a single probe expansion. With
+observation weights w_nj the least-squares fit has a diagonal Hessian
+h_j = Σ_n w_nj a_n², so per seed
+
+    q_j = Σ_n w_nj a_n (Ŝ_nj - b_n) / h_j     (unconstrained optimum)
+    p   = argmin Σ_j h_j (p_j - q_j)²  over the simplex
+
+The projection is exact (sorting the breakpoints of its KKT conditions)
+and the whole batch runs as array operations.
+
+explore_seed is not covered: its saturation, pruning and resonance make
+shells depend nonlinearly on the seed.
+"""
+
+import numpy as np
+
+from seed_expansion import influence_operator, encode_seeds_binary, expand_seed
+from orbital_octa_v2 import grow
+import orbital_octa_v2
+
+
+# =============================================================================
+# SIMPLEX PROJECTION
+# =============================================================================
+
+def project_to_simplex(q, h=None):
+    """
+    Weighted projection onto the probability simplex.
+
+    q : (..., 6) points, h : (..., 6) positive weights (default 1).
+
+    Returns p minimizing Σ_j h_j (p_j - q_j)² with p ≥ 0, Σ p = 1. The
+    solution is p_j = max(0, q_j - τ / h_j); τ is found from the sorted
+    breakpoints q_j h_j, for every row at once.
+    """
+    q = np.asarray(q, dtype=float)
+    h = np.ones_like(q) if h is None else np.broadcast_to(np.asarray(h, dtype=float), q.shape)
+
+    # Directions enter the active set in order of decreasing q_j h_j
+    order = np.argsort(-q * h, axis=-1)
+    q_sorted = np.take_along_axis(q, order, axis=-1)
+    h_sorted = np.take_along_axis(h, order, axis=-1)
+    inv_h = np.cumsum(1 / h_sorted, axis=-1)
+    tau = (np.cumsum(q_sorted, axis=-1) - 1) / inv_h
+
+    # Largest active set whose threshold keeps its last member positive
+    valid = q_sorted * h_sorted > tau
+    k = q.shape[-1] - 1 - np.argmax(valid[..., ::-1], axis=-1)
+    tau_k = np.take_along_axis(tau, k[..., None], axis=-1)
+    return np.maximum(q - tau_k / h, 0.0)
+
+
+# =============================================================================
+# BATCHED FIT
+# =============================================================================
+
+def shell_response(steps, engine='expand', **params):
+    """
+    Affine response of each shell to the seed proportions.
+
+    Parameters:
+    -----------
+    steps : int
+        Deepest shell needed
+    engine : str
+        'expand' (expand_seed) or 'grow' (orbital_octa_v2.grow)
+    **params
+        The engine's growth parameters
+
+    Returns:
+    --------
+    a, b : ndarray (steps + 1,)
+        S_n = a_n × p + b_n for any seed proportions p
+    """
+    if engine == 'expand':
+        W = influence_operator()
+        run = expand_seed
+    elif engine == 'grow':
+        W = orbital_octa_v2.influence_operator(params.get('sharpness', 2.0))
+        run = lambda seed, steps, **params: grow(seed, steps=steps, **params)[0]
+    else:
+        raise ValueError(f"unknown engine {engine!r}; expected 'expand' or 'grow'")
+    # Both engines' octahedral operators are W = c·I, so every shell is
+    # affine in the seed and one probe run gives its coefficients
+    assert W.ndim == 1 and np.all(W == W[0]), "closed-form recovery needs W = c·I"
+
+    # A seed concentrated on +X reads α_n off its first direction
+    shells = run(np.array([1.0, 0, 0, 0, 0, 0]), steps=steps, **params)
+    E = shells.E
+    alpha = (shells.S[:, 0] / E - 1 / 6) * 6 / 5
+    return E * alpha, E * (1 - alpha) / 6
+
+
+def recover_seeds(observed, shell_ids=None, engine='expand', weights=None,
+                  ridge=1e-12, **params):
+    """
+    Fit seed proportions to observed shells, for many observations.
+
+    Parameters:
+    -----------
+    observed : array-like, shape (N, K, 6) or (K, 6)
+        Observed shell amplitudes; NaN marks a missing value
+    shell_ids : array-like (K,), optional
+        Shell index of each observed shell (default 0..K-1); outer
+        shells alone are enough while their field still carries the
+        seed (see shell_response)
+    engine : str
+        Growth engine that produced the shells ('expand' or 'grow')
+    weights : array-like broadcastable to (N, K, 6), optional
+        Inverse noise variances (default 1: every value equally noisy)
+    ridge : float
+        Pull toward uniform proportions, relative to the total response
+        Σ_n a_n²; keeps directions that carry no information determined
+    **params
+        The engine's growth parameters (E0, r0, rho, epsilon, ...)
+
+    Returns:
+    --------
+    seeds : ndarray (N, 6) (or (6,) for a single observation)
+        Recovered proportions on the simplex
+    residual : ndarray (N,) (or float)
+        Weighted RMS misfit of the fitted shells, in amplitude units
+    """
+    observed = np.asarray(observed, dtype=float)
+    single = observed.ndim == 2
+    if single:
+        observed = observed[None]
+    N, K, _ = observed.shape
+
+    ids = np.arange(K) if shell_ids is None else np.asarray(shell_ids, dtype=int)
+    a, b = shell_response(int(ids.max()) if len(ids) else 0, engine, **params)
+    a = a[ids][:, None]  # (K, 1)
+    b = b[ids][:, None]
+
+    w = np.ones(observed.shape) if weights is None else np.broadcast_to(
+        np.asarray(weights, dtype=float), observed.shape).copy()
+    missing = np.isnan(observed)
+    w[missing] = 0.0
+    S = np.where(missing, 0.0, observed)
+
+    # Normal equations: diagonal Hessian, one 6-vector per observation
+    ridge = ridge * max(float((a**2).sum()), 1e-300)
+    h = (w * a**2).sum(axis=1) + ridge
+    q = ((w * a * (S - b)).sum(axis=1) + ridge / 6) / h
+    seeds = project_to_simplex(q, h)
+
+    misfit = w * (S - (a * seeds[:, None, :] + b))**2
+    residual = np.sqrt(misfit.sum(axis=(1, 2)) / np.maximum(w.sum(axis=(1, 2)), 1e-300))
+
+    if single:
+        return seeds[0], float(residual[0])
+    return seeds, residual
+
+
+def compress_observations(observed, bits_per_value=8, **kwargs):
+    """
+    Recover seeds from observed shells and pack them as seed records.
+
+    Keyword arguments go to recover_seeds. Returns (records, residual):
+    the encode_seeds_binary bytes (one record per observation) and the
+    fit residuals.
+    """
+    seeds, residual = recover_seeds(observed, **kwargs)
+    return encode_seeds_binary(seeds, bits_per_value), residual
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    import time
+    from seed_expansion import expand_seeds_batch, decode_seeds_binary
+
+    print("="*60)
+    print("SEED INVERSE")
+    print("="*60)
+
+    # Forward model check: every shell is affine in the seed
+    seed = np.array([0.5, 0.2, 0.15, 0.08, 0.05, 0.02])
+    shells = expand_seed(seed, steps=15)
+    grown, _ = grow(seed, steps=15, sharpness=3.0)
+    model_error = 0.0
+    for engine, s, params in [('expand', shells, {}), ('grow', grown, {'sharpness': 3.0})]:
+        a, b = shell_response(15, engine, **params)
+        model_error = max(model_error, np.max(np.abs(s.S - (a[:, None] * seed + b[:, None]))))
+    print(f"\nMax |S_n - (a_n p + b_n)| (expand_seed, grow): {model_error:.2e}")
+
+    # Exact recovery from outer shells only
+    recovered, _ = recover_seeds(shells.S[10:], shell_ids=range(10, 16))
+    recovered_grow, _ = recover_seeds(grown.S[3:8], shell_ids=range(3, 8),
+                                      engine='grow', sharpness=3.0)
+    print(f"Recovered from expand_seed shells 10-15: {np.round(recovered, 4)}")
+    print(f"Recovered from grow shells 3-7:          {np.round(recovered_grow, 4)}")
+    exact_error = max(np.max(np.abs(recovered - seed)), np.max(np.abs(recovered_grow - seed)))
+
+    # Noisy, incomplete observations in bulk
+    rng = np.random.default_rng(0)
+    seeds = rng.dirichlet(np.ones(6), size=200_000)
+    S, r, E = expand_seeds_batch(seeds, steps=12)
+    outer = S[:, 6:]  # Shells 6..12
+    noisy = outer + rng.normal(scale=0.02, size=outer.shape) * E[6:, None]
+    noisy[rng.random(noisy.shape) < 0.1] = np.nan  # 10% of values lost
+
+    t0 = time.perf_counter()
+    fitted, residual = recover_seeds(noisy, shell_ids=range(6, 13))
+    t1 = time.perf_counter()
+    error = np.abs(fitted - seeds).max(axis=1)
+    print(f"\n{len(seeds)} noisy observations (7 outer shells, 10% missing): "
+          f"{t1 - t0:.2f}s ({len(seeds) / (t1 - t0):.0f} seeds/s)")
+    print(f"Proportion error: median {np.median(error):.4f}, max {error.max():.4f}")
+    on_simplex = np.allclose(fitted.sum(axis=1), 1) and (fitted >= 0).all()
+    print(f"All fits on the simplex: {on_simplex}")
+
+    records, _ = compress_observations(noisy, shell_ids=range(6, 13))
+    quantized = decode_seeds_binary(records)
+    print(f"Compressed to {len(records)} bytes; "
+          f"max quantized error {np.abs(quantized - seeds).max(axis=1).max():.4f}")
+
+    passed = model_error < 1e-12 and exact_error < 1e-9 and on_simplex
+    print(f"\nStatus: {'PASS' if passed else 'FAIL'}")
@@ -0,0 +1,513 @@
+"""
+Seed Service: Micro-Batched Seed Decompression over asyncio
+
+A TCP service that turns encoded seeds into shell structures. Requests
+that arrive within a short latency window (or until a batch fills) are
+decoded and expanded together (iter_seeds_batch, the lockstep engine of
+expand_seeds_batch), so under load the server runs a few large
+vectorized batches instead of one expand_seed per request.
+
+Shells are streamed: the batch grows a few shells at a time, and after
+each stage every request is sent the shells it has not seen yet. A
+shallow request finishes as soon as its own depth is reached, served by
+a prefix of the deeper ones (every prefix of an expansion is itself the
+expansion).
+
+Wire format (little-endian):
+
+    request   u32 request id, u16 steps, record (seed_record_size bytes)
+    response  one 72-byte frame per shell, in shell order:
+              u32 request id, u16 shell index, u16 flags,
+              f64 r, f64 E, 6 x f64 S
+              flags: 1 = last shell of the request, 2 = error (the
+              request was rejected or its batch failed, or the service
+              closed first; a single frame, no shells)
+
+Requests on one connection may be pipelined; responses carry the id
+and may interleave, but the shells of one request arrive in order.
+
+Run `python seed_service.py` for a local load test comparing
+micro-batching against one request per batch.
+"""
+
+import asyncio
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from seed_expansion import (
+    iter_seeds_batch,
+    encode_seeds_binary,
+    decode_seeds_binary,
+    seed_record_size,
+)
+
+# Request header: request id, steps
+REQUEST_HEADER = struct.Struct('<IH')
+
+SHELL_FRAME = np.dtype([
+    ('id', '<u4'), ('shell', '<u2'), ('flags', '<u2'),
+    ('r', '<f8'), ('E', '<f8'), ('S', '<f8', (6,)),
+])
+
+FLAG_LAST = 1
+FLAG_ERROR = 2
+
+# Growth parameters accepted by the service, with expand_seed's defaults
+SERVICE_PARAMS = {'E0': 1.0, 'r0': 1.0, 'rho': 1.5, 'epsilon': 0.6, 'sigma_scale': 0.5}
+
+
+# =============================================================================
+# SERVER
+# =============================================================================
+
+class SeedService:
+    """
+    asyncio server expanding encoded seeds in micro-batches.
+
+    Parameters:
+    -----------
+    bits_per_value : int
+        Quantization of the seed records clients send
+    max_batch : int
+        Largest batch run at once
+    max_delay : float
+        Seconds the first request of a batch may wait for others
+    max_steps : int
+        Deepest expansion a request may ask for
+    stream_shells : int
+        Shells a batch grows between sends
+    **params
+        Growth parameters (E0, r0, rho, epsilon, sigma_scale)
+
+    Attributes:
+    -----------
+    stats : dict
+        'requests', 'batches', 'rejected' (invalid requests), 'failed'
+        (requests whose expansion raised) and 'largest_batch'
+    """
+
+    def __init__(self, bits_per_value=8, max_batch=1024, max_delay=0.002,
+                 max_steps=256, stream_shells=4, **params):
+        unknown = set(params) - set(SERVICE_PARAMS)
+        if unknown:
+            raise TypeError(f"unexpected growth parameters: {sorted(unknown)}")
+        self.bits_per_value = bits_per_value
+        self.record_size = seed_record_size(bits_per_value)
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_steps = max_steps
+        self.stream_shells = max(int(stream_shells), 1)
+        self.params = {**SERVICE_PARAMS, **params}
+        self.stats = dict.fromkeys(
+            ('requests', 'batches', 'rejected', 'failed', 'largest_batch'), 0
+        )
+
+        self._pending = []
+        self._running = []
+        self._wakeup = None
+        self._full = None
+        self._server = None
+        self._batcher = None
+        # One expansion at a time; requests queue up into the next batch
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    @property
+    def port(self):
+        return self._server.sockets[0].getsockname()[1]
+
+    async def start(self, host='127.0.0.1', port=0):
+        """Listen on host:port (port 0 picks a free port, see .port)."""
+        self._wakeup = asyncio.Event()
+        self._full = asyncio.Event()
+        self._batcher = asyncio.create_task(self._run_batches())
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self
+
+    async def serve_forever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        """
+        Stop the service. Requests still queued or expanding fail with
+        ConnectionError (clients receive an error frame).
+        """
+        self._server.close()
+        self._batcher.cancel()
+        try:
+            await self._batcher
+        except asyncio.CancelledError:
+            pass
+        error = ConnectionError("seed service closed")
+        for _, _, queue in self._running + self._pending:
+            queue.put_nowait(error)
+        self._running = []
+        self._pending = []
+        await self._server.wait_closed()
+        self._executor.shutdown()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def stream(self, record, steps):
+        """
+        Expand one encoded record through the batcher, shells as they grow.
+
+        Yields (first, r, E, S) blocks of consecutive shells, first being
+        the index of the block's first shell, until steps + 1 shells have
+        been yielded.
+        """
+        if not 0 <= steps <= self.max_steps:
+            raise ValueError(f"steps must be in [0, {self.max_steps}], got {steps}")
+        if len(record) != self.record_size:
+            raise ValueError(f"expected a {self.record_size}-byte record, got {len(record)}")
+        queue = asyncio.Queue()
+        self._pending.append((bytes(record), steps, queue))
+        self._wakeup.set()
+        if len(self._pending) >= self.max_batch:
+            self._full.set()
+
+        first = 0
+        while first <= steps:
+            block = await queue.get()
+            if isinstance(block, BaseException):
+                raise block
+            r, E, S = block
+            yield first, r, E, S
+            first += len(r)
+
+    async def expand(self, record, steps):
+        """
+        Expand one encoded record through the batcher.
+
+        Returns (r, E, S) with steps + 1 shells; S is (steps + 1, 6).
+        """
+        blocks = [block async for block in self.stream(record, steps)]
+        return tuple(np.concatenate([block[k] for block in blocks]) for k in (1, 2, 3))
+
+    # -------------------------------------------------------------------------
+    # Batching
+    # -------------------------------------------------------------------------
+
+    async def _run_batches(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            if len(self._pending) < self.max_batch:
+                # Latency window: collect until it closes or the batch fills
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.max_delay)
+                except asyncio.TimeoutError:
+                    pass
+
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            if len(self._pending) < self.max_batch:
+                self._full.clear()
+            if not self._pending:
+                self._wakeup.clear()
+
+            self.stats['batches'] += 1
+            self.stats['requests'] += len(batch)
+            self.stats['largest_batch'] = max(self.stats['largest_batch'], len(batch))
+            # Kept while expanding, so close() can fail it if cancelled
+            self._running = batch
+            sent = [0] * len(batch)
+            try:
+                steps_iter, deepest = await loop.run_in_executor(
+                    self._executor, self._start_batch, batch
+                )
+                n = -1
+                while n < deepest:
+                    r, E, S, n = await loop.run_in_executor(
+                        self._executor, self._advance, steps_iter
+                    )
+                    # Shells 0..n are final: hand each request its new ones
+                    for i, (_, steps, queue) in enumerate(batch):
+                        hi = min(n, steps) + 1
+                        if hi > sent[i]:
+                            queue.put_nowait((r[sent[i]:hi], E[sent[i]:hi], S[sent[i]:hi, i]))
+                            sent[i] = hi
+            except Exception as exc:
+                for (_, steps, queue), done in zip(batch, sent):
+                    if done <= steps:
+                        queue.put_nowait(exc)
+            self._running = []
+
+    def _start_batch(self, batch):
+        records = np.frombuffer(b''.join(record for record, _, _ in batch), dtype=np.uint8)
+        seeds = decode_seeds_binary(records, self.bits_per_value)
+        steps = max(steps for _, steps, _ in batch)
+        return iter_seeds_batch(seeds, steps=steps, **self.params), steps
+
+    def _advance(self, steps_iter):
+        # Grow up to stream_shells shells; returns the last (r, E, S, n)
+        for _, state in zip(range(self.stream_shells), steps_iter):
+            pass
+        return state
+
+    # -------------------------------------------------------------------------
+    # Connections
+    # -------------------------------------------------------------------------
+
+    async def _handle(self, reader, writer):
+        size = REQUEST_HEADER.size + self.record_size
+        tasks = set()
+        try:
+            while True:
+                try:
+                    request = await reader.readexactly(size)
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                request_id, steps = REQUEST_HEADER.unpack_from(request)
+                task = asyncio.create_task(
+                    self._respond(writer, request_id, request[REQUEST_HEADER.size:], steps)
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def _respond(self, writer, request_id, record, steps):
+        try:
+            async for first, r, E, S in self.stream(record, steps):
+                frames = np.empty(len(r), dtype=SHELL_FRAME)
+                frames['id'] = request_id
+                frames['shell'] = np.arange(first, first + len(r))
+                frames['flags'] = 0
+                if first + len(r) == steps + 1:
+                    frames['flags'][-1] = FLAG_LAST
+                frames['r'] = r
+                frames['E'] = E
+                frames['S'] = S
+                if not await self._send(writer, frames):
+                    return
+        except Exception as exc:
+            # Every request gets an answer, or its client would wait forever
+            self.stats['rejected' if isinstance(exc, ValueError) else 'failed'] += 1
+            frames = np.zeros(1, dtype=SHELL_FRAME)
+            frames['id'] = request_id
+            frames['flags'] = FLAG_LAST | FLAG_ERROR
+            await self._send(writer, frames)
+
+    async def _send(self, writer, frames):
+        # False once the client has gone away
+        if writer.is_closing():
+            return False
+        writer.write(frames.tobytes())
+        try:
+            await writer.drain()
+        except ConnectionError:
+            return False
+        return True
+
+
+# =============================================================================
+# CLIENT
+# =============================================================================
+
+class SeedClient:
+    """
+    Pipelining client for SeedService.
+
+    Many requests may be in flight on one connection; each is routed
+    back by its id.
+
+        client = await SeedClient.connect(host, port)
+        r, E, S = await client.expand(seed, steps=10)
+        async for shell in client.stream(seed, steps=10): ...
+        await client.close()
+    """
+
+    def __init__(self, reader, writer, bits_per_value=8):
+        self.bits_per_value = bits_per_value
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._streams = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=0, bits_per_value=8):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer, bits_per_value)
+
+    async def close(self):
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._receiver.cancel()
+        try:
+            await self._receiver
+        except asyncio.CancelledError:
+            pass
+
+    async def stream(self, seed, steps=10):
+        """
+        Request an expansion and yield its shells as they arrive.
+
+        seed : encoded record (bytes) or proportions (quantized here)
+        Yields dicts with 'id' (shell index), 'r', 'E', 'S'.
+        """
+        if not isinstance(seed, (bytes, bytearray, memoryview)):
+            seed = encode_seeds_binary(seed, self.bits_per_value)
+        request_id = self._next_id
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        queue = self._streams[request_id] = asyncio.Queue()
+        try:
+            self._writer.write(REQUEST_HEADER.pack(request_id, steps) + bytes(seed))
+            # Let the socket buffer drain: a long request stream would
+            # otherwise queue without limit in the transport
+            await self._writer.drain()
+            while True:
+                frames = await queue.get()
+                if frames is None:
+                    raise ConnectionError("connection closed before the expansion finished")
+                if (frames['flags'] & FLAG_ERROR).any():
+                    raise ValueError(f"request rejected or failed on the server (steps={steps})")
+                for shell, r, E, S in zip(frames['shell'].tolist(), frames['r'].tolist(),
+                                          frames['E'].tolist(), frames['S']):
+                    yield {'id': shell, 'r': r, 'E': E, 'S': S}
+                if frames['flags'][-1] & FLAG_LAST:
+                    return
+        finally:
+            del self._streams[request_id]
+
+    async def expand(self, seed, steps=10):
+        """Request an expansion; returns (r, E, S) arrays."""
+        shells = [shell async for shell in self.stream(seed, steps)]
+        return (np.array([shell['r'] for shell in shells]),
+                np.array([shell['E'] for shell in shells]),
+                np.array([shell['S'] for shell in shells]).reshape(-1, 6))
+
+    async def _receive(self):
+        buffer = b''
+        try:
+            while True:
+                data = await self._reader.read(1 << 16)
+                if not data:
+                    break
+                buffer += data
+                whole = len(buffer) // SHELL_FRAME.itemsize * SHELL_FRAME.itemsize
+                frames = np.frombuffer(buffer[:whole], dtype=SHELL_FRAME)
+                buffer = buffer[whole:]
+                # Route runs of frames sharing a request id in one piece
+                ids = frames['id']
+                cuts = np.flatnonzero(ids[1:] != ids[:-1]) + 1
+                for lo, hi in zip([0, *cuts.tolist()], [*cuts.tolist(), len(frames)]):
+                    queue = self._streams.get(int(ids[lo]))
+                    if queue is not None and hi > lo:
+                        queue.put_nowait(frames[lo:hi])
+        finally:
+            for queue in self._streams.values():
+                queue.put_nowait(None)
+
+
+# =============================================================================
+# LOAD GENERATOR
+# =============================================================================
+
+async def load_test(host, port, seeds, steps=10, concurrency=256, connections=4,
+                    bits_per_value=8):
+    """
+    Send every seed as a request and measure latency and throughput.
+
+    Parameters:
+    -----------
+    seeds : array-like (N, 6)
+        One request per seed
+    concurrency : int
+        Requests in flight at once (spread over the connections)
+    connections : int
+        Client connections to open
+
+    Returns:
+    --------
+    report : dict
+        'requests', 'seconds', 'requests_per_s', 'shells_per_s' and
+        latency percentiles 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms'
+    """
+    records = encode_seeds_binary(seeds, bits_per_value)
+    size = seed_record_size(bits_per_value)
+    n = len(records) // size
+    clients = [await SeedClient.connect(host, port, bits_per_value) for _ in range(connections)]
+    latencies = np.empty(n)
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with gate:
+            t0 = time.perf_counter()
+            await clients[i % connections].expand(records[i * size:(i + 1) * size], steps)
+            latencies[i] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    try:
+        await asyncio.gather(*(one(i) for i in range(n)))
+    finally:
+        for client in clients:
+            await client.close()
+    seconds = time.perf_counter() - t0
+
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) * 1e3 if n else (0.0,) * 3
+    return {
+        'requests': n,
+        'seconds': seconds,
+        'requests_per_s': n / seconds,
+        'shells_per_s': n * (steps + 1) / seconds,
+        'p50_ms': float(p50),
+        'p90_ms': float(p90),
+        'p99_ms': float(p99),
+        'max_ms': float(latencies.max() * 1e3) if n else 0.0,
+    }
+
+
+# =============================================================================
+# DEMO
+# =============================================================================
+
+if __name__ == "__main__":
+    from seed_expansion import expand_seed
+
+    print("="*60)
+    print("SEED SERVICE")
+    print("="*60)
+
+    seeds = np.random.default_rng(0).dirichlet(np.ones(6), size=5000)
+
+    async def main():
+        reports = {}
+        for label, max_batch in [("one request per batch", 1), ("micro-batched", 1024)]:
+            async with SeedService(max_batch=max_batch, max_delay=0.002) as service:
+                reports[label] = await load_test('127.0.0.1', service.port, seeds,
+                                                 steps=15, concurrency=512)
+                stats = service.stats
+            report = reports[label]
+            print(f"\n{label}: {stats['batches']} batches "
+                  f"(largest {stats['largest_batch']})")
+            print(f"  {report['requests_per_s']:.0f} requests/s, "
+                  f"p50 {report['p50_ms']:.1f} ms, p99 {report['p99_ms']:.1f} ms")
+
+        # Served shells equal a direct expansion of the quantized seed
+        async with SeedService() as service:
+            client = await SeedClient.connect('127.0.0.1', service.port)
+            record = encode_seeds_binary(seeds[0])
+            r, E, S = await client.expand(record, steps=15)
+            try:
+                await client.expand(record, steps=service.max_steps + 1)
+                rejected = False
+            except ValueError:
+                rejected = True
+            await client.close()
+        direct = expand_seed(decode_seeds_binary(record)[0], steps=15)
+        match = np.array_equal(S, direct.S) and np.array_equal(r, direct.r)
+        print(f"\nShells match expand_seed: {match}")
+        print(f"Over-deep request rejected: {rejected}")
+        print(f"\nStatus: {'PASS' if match and rejected else 'FAIL'}")
+
+    asyncio.run(main())
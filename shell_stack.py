@@ -0,0 +1,266 @@
+"""
+Shell Stack: Struct-of-Arrays Shell Storage
+
+Growth engines used to return shells as a list of small dicts, one
+NumPy array per shell. ShellStack keeps the same information in a few
+contiguous arrays instead:
+
+    id       (n,)     shell index
+    r        (n,)     radius
+    E        (n,)     energy budget
+    S        (n, 6)   amplitudes [+X, -X, +Y, -Y, +Z, -Z]
+    error    (n,)     amplitude error bound from a truncated horizon
+    mode     (n,)     growth mode code (exploration only)
+    epsilon  (n,)     energy decay used for the shell (exploration only)
+
+Appends are amortized O(1) (capacity doubles), slices share memory with
+the parent, and integer indexing / iteration hand out dicts with the
+legacy {'id', 'r', 'E', 'S', ...} keys so existing callers keep working.
+"""
+
+import numpy as np
+
+# =============================================================================
+# GROWTH MODES
+# =============================================================================
+
+MODES = ('SEED', 'EXPLORE', 'EXPAND')
+
+MODE_SEED = 0
+MODE_EXPLORE = 1
+MODE_EXPAND = 2
+
+
+# =============================================================================
+# SHELL STACK
+# =============================================================================
+
+class ShellStack:
+    """
+    Contiguous, growable storage for a shell structure.
+
+    Parameters:
+    -----------
+    capacity : int
+        Initial number of shells to allocate room for
+    modes : bool
+        Also track per-shell 'mode' and 'epsilon' (exploration)
+    dtype : numpy dtype
+        Floating precision of r, E, S, error and epsilon (ids and mode
+        codes keep their integer types)
+
+    Attributes:
+    -----------
+    error_bound : float
+        Upper bound on the absolute amplitude error introduced by a
+        truncated field horizon (0.0 when the expansion is exact)
+    params : dict or None
+        Engine and growth parameters the shells were grown with, as
+        recorded by grow / expand_seed ({'engine': ..., 'rho': ...});
+        None when unknown
+    """
+
+    def __init__(self, capacity=16, modes=False, dtype=np.float64):
+        capacity = max(int(capacity), 1)
+        self._n = 0
+        self._modes = modes
+        self.error_bound = 0.0
+        self.params = None
+        self._id = np.empty(capacity, dtype=np.int64)
+        self._r = np.empty(capacity, dtype=dtype)
+        self._E = np.empty(capacity, dtype=dtype)
+        self._S = np.empty((capacity, 6), dtype=dtype)
+        self._error = np.empty(capacity, dtype=dtype)
+        if modes:
+            self._mode = np.empty(capacity, dtype=np.int8)
+            self._epsilon = np.empty(capacity, dtype=dtype)
+
+    # -------------------------------------------------------------------------
+    # Array views
+    # -------------------------------------------------------------------------
+
+    @property
+    def id(self):
+        return self._id[:self._n]
+
+    @property
+    def r(self):
+        return self._r[:self._n]
+
+    @property
+    def E(self):
+        return self._E[:self._n]
+
+    @property
+    def S(self):
+        return self._S[:self._n]
+
+    @property
+    def error(self):
+        """Per-shell amplitude error bounds (error_bound is their max)."""
+        return self._error[:self._n]
+
+    @property
+    def mode(self):
+        """Mode codes (index into MODES), or None without mode tracking."""
+        return self._mode[:self._n] if self._modes else None
+
+    @property
+    def epsilon(self):
+        """Per-shell decay factors (NaN where undefined), or None."""
+        return self._epsilon[:self._n] if self._modes else None
+
+    @property
+    def has_modes(self):
+        return self._modes
+
+    @property
+    def dtype(self):
+        return self._S.dtype
+
+    @property
+    def capacity(self):
+        return len(self._r)
+
+    @property
+    def nbytes(self):
+        """Bytes held by the backing arrays (including spare capacity)."""
+        total = self._id.nbytes + self._r.nbytes + self._E.nbytes + self._S.nbytes
+        total += self._error.nbytes
+        if self._modes:
+            total += self._mode.nbytes + self._epsilon.nbytes
+        return total
+
+    # -------------------------------------------------------------------------
+    # Growth
+    # -------------------------------------------------------------------------
+
+    def reserve(self, capacity):
+        """Make room for at least `capacity` shells without reallocating."""
+        if capacity <= self.capacity:
+            return
+        n = self._n
+        for name in self._array_names():
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:n] = old[:n]
+            setattr(self, name, new)
+
+    def append(self, r, E, S, mode=None, epsilon=None, id=None, error=0.0):
+        """
+        Append one shell.
+
+        id defaults to the previous shell's id + 1 (0 for the first).
+        mode may be a name from MODES or a mode code; epsilon=None is
+        stored as NaN. error is the shell's amplitude error bound.
+        """
+        n = self._n
+        if n == self.capacity:
+            self.reserve(max(2 * n, 16))
+        if id is None:
+            id = self._id[n - 1] + 1 if n else 0
+        self._id[n] = id
+        self._r[n] = r
+        self._E[n] = E
+        self._S[n] = S
+        self._error[n] = error
+        if self._modes:
+            self._mode[n] = MODES.index(mode) if isinstance(mode, str) else mode
+            self._epsilon[n] = np.nan if epsilon is None else epsilon
+        self._n = n + 1
+
+    # -------------------------------------------------------------------------
+    # Sequence protocol (dict-compatible view)
+    # -------------------------------------------------------------------------
+
+    def __len__(self):
+        return self._n
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._view(index)
+        n = self._n
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("shell index out of range")
+        return self._shell_dict(index)
+
+    def __iter__(self):
+        for i in range(self._n):
+            yield self._shell_dict(i)
+
+    def __repr__(self):
+        extra = ", modes=True" if self._modes else ""
+        if self._S.dtype != np.float64:
+            extra += f", dtype={self._S.dtype}"
+        return f"ShellStack(n={self._n}{extra})"
+
+    def to_dicts(self):
+        """Legacy list-of-dicts representation (S rows are copies)."""
+        shells = []
+        for shell in self:
+            shell['S'] = shell['S'].copy()
+            shells.append(shell)
+        return shells
+
+    @classmethod
+    def from_dicts(cls, shells):
+        """Build a stack from a list of shell dicts."""
+        modes = len(shells) > 0 and 'mode' in shells[0]
+        stack = cls(capacity=len(shells), modes=modes)
+        for shell in shells:
+            stack.append(
+                shell['r'], shell['E'], shell['S'],
+                mode=shell.get('mode'), epsilon=shell.get('epsilon'),
+                id=shell['id'], error=shell.get('error', 0.0)
+            )
+        return stack
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+
+    def _array_names(self):
+        names = ['_id', '_r', '_E', '_S', '_error']
+        if self._modes:
+            names += ['_mode', '_epsilon']
+        return names
+
+    def _shell_dict(self, i):
+        shell = {
+            'id': int(self._id[i]),
+            'r': float(self._r[i]),
+            'E': float(self._E[i]),
+            'S': self._S[i]
+        }
+        if self._modes:
+            eps = self._epsilon[i]
+            shell['mode'] = MODES[self._mode[i]]
+            shell['epsilon'] = None if np.isnan(eps) else float(eps)
+        return shell
+
+    def _view(self, index):
+        # Views are sized exactly, so appending to a slice reallocates
+        # instead of overwriting the parent's later shells.
+        view = ShellStack.__new__(ShellStack)
+        view._modes = self._modes
+        view.error_bound = self.error_bound
+        view.params = self.params
+        for name in self._array_names():
+            setattr(view, name, getattr(self, name)[:self._n][index])
+        view._n = len(view._r)
+        return view
+
+
+def as_arrays(shells):
+    """
+    Return (r, S) arrays for a ShellStack or a list of shell dicts.
+
+    ShellStack is returned without copying.
+    """
+    if isinstance(shells, ShellStack):
+        return shells.r, shells.S
+    r = np.array([shell['r'] for shell in shells], dtype=float)
+    S = np.array([shell['S'] for shell in shells], dtype=float).reshape(-1, 6)
+    return r, S